@@ -24,14 +24,17 @@ try:
 except ImportError:
     pass  # Runtime not present (development mode)
 
+import asyncio
+import functools
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
@@ -39,26 +42,163 @@ from .const import (
     VERSION,
     CONF_SENSOR_SMARTMETER_IMPORT_KWH,
     CONF_WEATHER_ENTITY,
+    CONFIG_UPDATE_DEBOUNCE_SECONDS,
     DAILY_AGGREGATION_HOUR,
     DAILY_AGGREGATION_MINUTE,
     DAILY_AGGREGATION_SECOND,
 )
 from .storage import DataValidator
-from .api import async_setup_views, async_setup_websocket
+from .api import async_setup_views, async_setup_websocket, invalidate_config_cache
 from .services.daily_aggregator import DailyEnergyAggregator
 from .services.billing_calculator import BillingCalculator
 from .services.monthly_tariff_manager import MonthlyTariffManager
+from .power_sources_collector import PowerSourcesCollector
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = []
+# Config keys that are only evaluated during entry setup - changing one of
+# them requires a full reload instead of an in-place config refresh
+STRUCTURAL_CONFIG_KEYS: frozenset[str] = frozenset({
+    CONF_SENSOR_SMARTMETER_IMPORT_KWH,
+    CONF_WEATHER_ENTITY,
+})
+
+
+def _get_paths(hass: HomeAssistant) -> dict[str, Path]:
+    """Return the shared integration paths, building them on first use. @zara"""
+    paths = hass.data.get(DOMAIN, {}).get("_paths")
+    if paths is None:
+        config_path = Path(hass.config.path())
+        paths = {
+            "config_path": config_path,
+            "power_sources_path": config_path / "sfml_stats" / "data",
+            "weather_path": config_path / "sfml_stats_weather",
+        }
+    return paths
+
+
+def _next_local_occurrence(hour: int, minute: int, second: int) -> datetime:
+    """Return the next local hour:minute:second as an aware UTC datetime. @zara
+
+    The target is built on Home Assistant's local wall clock and only then
+    converted to UTC, so days with a daylight-saving transition (23 or 25
+    hours long) still resolve to the correct instant.
+    """
+    local = dt_util.now()
+    target = local.replace(hour=hour, minute=minute, second=second, microsecond=0)
+    if target <= local:
+        target += timedelta(days=1)
+    return dt_util.as_utc(target)
+
+
+@callback
+def _async_schedule_daily_job(hass: HomeAssistant) -> None:
+    """Arm the timer for the next daily aggregation run. @zara
+
+    A single timer serves all config entries; its unsubscribe callback is
+    kept in hass.data[DOMAIN]["_daily_job_unsub"].
+    """
+    hass.data[DOMAIN]["_daily_job_unsub"] = async_track_point_in_utc_time(
+        hass,
+        functools.partial(_async_fire_daily_job, hass),
+        _next_local_occurrence(
+            DAILY_AGGREGATION_HOUR,
+            DAILY_AGGREGATION_MINUTE,
+            DAILY_AGGREGATION_SECOND,
+        ),
+    )
+
+
+@callback
+def _async_fire_daily_job(hass: HomeAssistant, now: datetime) -> None:
+    """Start the daily aggregation and re-arm the timer. @zara"""
+    # Eager start runs the job synchronously up to its first real await,
+    # so a no-op aggregation finishes without ever scheduling a task step
+    hass.async_create_task(
+        _daily_aggregation_job(hass),
+        f"{DOMAIN}_daily_aggregation",
+        eager_start=True,
+    )
+    _async_schedule_daily_job(hass)
+
+
+@callback
+def _async_cancel_daily_job(hass: HomeAssistant, event: Event | None = None) -> None:
+    """Cancel the pending daily aggregation timer. @zara"""
+    unsub = hass.data.get(DOMAIN, {}).pop("_daily_job_unsub", None)
+    if unsub is not None:
+        unsub()
+
+
+async def _daily_aggregation_job(hass: HomeAssistant) -> None:
+    """Run daily aggregation job for all loaded entries. @zara"""
+    # Entries share one aggregator instance - run each instance only once
+    aggregators = {
+        id(entry_data["aggregator"]): entry_data["aggregator"]
+        for entry_data in hass.data.get(DOMAIN, {}).values()
+        if isinstance(entry_data, dict) and entry_data.get("aggregator")
+    }
+    if not aggregators:
+        return
+
+    _LOGGER.info("Starting scheduled daily energy aggregation")
+    results = await asyncio.gather(
+        *(aggregator.async_aggregate_daily() for aggregator in aggregators.values()),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, BaseException):
+            _LOGGER.error("Daily aggregation failed: %s", result)
+
+
+async def _async_get_shared_validator(hass: HomeAssistant) -> DataValidator | None:
+    """Return the DataValidator shared by all entries, initializing it once. @zara
+
+    Concurrent entry setups await the same initialization task.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    init_task = domain_data.get("_validator_init")
+    if init_task is None:
+        validator = DataValidator(hass)
+        domain_data["_validator"] = validator
+        init_task = domain_data["_validator_init"] = hass.async_create_task(
+            validator.async_initialize(), f"{DOMAIN}_validator_init"
+        )
+
+    if not await init_task:
+        # Let the next setup attempt retry the initialization
+        if domain_data.get("_validator_init") is init_task:
+            domain_data.pop("_validator", None)
+            domain_data.pop("_validator_init", None)
+        return None
+
+    return domain_data["_validator"]
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the SFML Stats component. @zara"""
     _LOGGER.info("Initializing %s v%s", NAME, VERSION)
 
-    hass.data.setdefault(DOMAIN, {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    paths = _get_paths(hass)
+    domain_data["_paths"] = paths
+
+    power_sources_path = paths["power_sources_path"]
+    await hass.async_add_executor_job(
+        lambda: power_sources_path.mkdir(parents=True, exist_ok=True)
+    )
+
+    _async_schedule_daily_job(hass)
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STOP, functools.partial(_async_cancel_daily_job, hass)
+    )
+    _LOGGER.info(
+        "Daily energy aggregation scheduled for %02d:%02d",
+        DAILY_AGGREGATION_HOUR,
+        DAILY_AGGREGATION_MINUTE,
+    )
 
     await async_setup_views(hass)
     await async_setup_websocket(hass)
@@ -90,10 +230,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SFML Stats from a config entry. @zara"""
     _LOGGER.info("Setting up %s (Entry: %s)", NAME, entry.entry_id)
 
-    validator = DataValidator(hass)
-    init_success = await validator.async_initialize()
-
-    if not init_success:
+    validator = await _async_get_shared_validator(hass)
+    if validator is None:
         _LOGGER.error("DataValidator could not be initialized")
         return False
 
@@ -123,21 +261,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         except Exception as err:
             _LOGGER.debug("Could not create persistent notification: %s", err)
 
-    config_path = Path(hass.config.path())
-    entry_config = dict(entry.data)
-    aggregator = DailyEnergyAggregator(hass, config_path)
+    paths = _get_paths(hass)
+    config_path = paths["config_path"]
+    # entry.data is already a read-only MappingProxyType - share it instead of copying
+    entry_config = entry.data
+    # The aggregator reads the first entry's config and writes one shared
+    # history file, so a single instance serves all entries
+    aggregator = hass.data[DOMAIN].get("_aggregator")
+    if aggregator is None:
+        aggregator = hass.data[DOMAIN]["_aggregator"] = DailyEnergyAggregator(
+            hass, config_path
+        )
     billing_calculator = BillingCalculator(hass, config_path, entry_data=entry_config)
     monthly_tariff_manager = MonthlyTariffManager(hass, config_path, entry_data=entry_config)
 
-    # Initialize Power Sources Collector with error handling
-    from .power_sources_collector import PowerSourcesCollector
-    power_sources_path = config_path / "sfml_stats" / "data"
-    power_sources_collector = PowerSourcesCollector(hass, entry_config, power_sources_path)
-    try:
-        await power_sources_collector.start()
-    except Exception as err:
-        _LOGGER.error("Failed to start power sources collector: %s", err)
-        # Collector is optional, integration can still function
+    power_sources_collector = PowerSourcesCollector(
+        hass, entry_config, paths["power_sources_path"]
+    )
 
     # Initialize Weather Collector if weather entity is configured
     # Note: WeatherDataCollector is a passive loader that reads from Solar Forecast ML
@@ -147,8 +287,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if weather_entity:
         try:
             from .weather_collector import WeatherDataCollector
-            weather_path = config_path / "sfml_stats_weather"
-            weather_collector = WeatherDataCollector(hass, weather_path)
+            weather_collector = WeatherDataCollector(hass, paths["weather_path"])
             _LOGGER.info("Weather collector initialized for entity: %s", weather_entity)
         except Exception as err:
             _LOGGER.error("Failed to initialize weather collector: %s", err)
@@ -163,47 +302,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "power_sources_collector": power_sources_collector,
         "weather_collector": weather_collector,
     }
+    invalidate_config_cache()
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
-    async def _daily_aggregation_job(now: datetime) -> None:
-        """Run daily aggregation job. @zara"""
-        _LOGGER.info("Starting scheduled daily energy aggregation")
-        try:
-            await aggregator.async_aggregate_daily()
-        except Exception as err:
-            _LOGGER.error("Daily aggregation failed: %s", err)
-
-    cancel_daily_job = async_track_time_change(
-        hass,
-        _daily_aggregation_job,
-        hour=DAILY_AGGREGATION_HOUR,
-        minute=DAILY_AGGREGATION_MINUTE,
-        second=DAILY_AGGREGATION_SECOND,
-    )
-    hass.data[DOMAIN][entry.entry_id]["cancel_daily_job"] = cancel_daily_job
-
-    _LOGGER.info(
-        "Daily energy aggregation scheduled for %02d:%02d",
-        DAILY_AGGREGATION_HOUR,
-        DAILY_AGGREGATION_MINUTE,
-    )
-
     smartmeter_import_kwh = entry.data.get(CONF_SENSOR_SMARTMETER_IMPORT_KWH)
 
+    # Collector start, billing baselines and the debug directory tree are
+    # independent I/O-bound steps - run them concurrently
+    setup_jobs = {"power_sources_collector": power_sources_collector.start()}
+
     if smartmeter_import_kwh:
         _LOGGER.info("Initializing billing baselines for kWh sensor: %s", smartmeter_import_kwh)
-        await billing_calculator.async_ensure_baselines()
+        setup_jobs["billing_baselines"] = billing_calculator.async_ensure_baselines()
     else:
         _LOGGER.debug("Billing calculation disabled - no kWh sensor configured")
 
-    tree = await validator.async_get_directory_tree()
-    _LOGGER.debug("Directory structure: %s", tree)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        setup_jobs["directory_tree"] = validator.async_get_directory_tree()
+
+    results = dict(zip(
+        setup_jobs,
+        await asyncio.gather(*setup_jobs.values(), return_exceptions=True),
+    ))
+
+    for result in results.values():
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+
+    # Collector is optional, integration can still function
+    if isinstance(results["power_sources_collector"], BaseException):
+        _LOGGER.error(
+            "Failed to start power sources collector: %s",
+            results["power_sources_collector"],
+        )
+
+    # Billing baselines and the directory tree stay fatal as before
+    for key in ("billing_baselines", "directory_tree"):
+        if isinstance(results.get(key), BaseException):
+            raise results[key]
+
+    if "directory_tree" in results:
+        _LOGGER.debug("Directory structure: %s", results["directory_tree"])
 
-    # Run initial aggregation as background task to not block startup
+    # Run initial aggregation as background task to not block startup.
+    # Skipped if today was already aggregated (e.g. after a restart); the
+    # scheduled 23:55 run always refreshes today's values.
     async def _initial_aggregation() -> None:
         """Run initial aggregation in background. @zara"""
         try:
+            if await aggregator.async_already_ran_today():
+                _LOGGER.debug("Daily aggregation already ran today, skipping initial run")
+                return
             await aggregator.async_aggregate_daily()
         except Exception as err:
             _LOGGER.error("Initial aggregation failed: %s", err)
@@ -213,11 +363,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         f"{DOMAIN}_initial_aggregation",
     )
 
-    _LOGGER.info(
-        "%s successfully set up. Export path: %s",
-        NAME,
-        validator.export_base_path
-    )
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(
+            "%s successfully set up. Export path: %s",
+            NAME,
+            validator.export_base_path
+        )
 
     return True
 
@@ -226,31 +377,29 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry. @zara"""
     _LOGGER.info("Unloading %s (Entry: %s)", NAME, entry.entry_id)
 
-    if entry.entry_id not in hass.data.get(DOMAIN, {}):
+    entry_data = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+    if entry_data is None:
         _LOGGER.warning("Entry %s not found in hass.data", entry.entry_id)
         return True
+    invalidate_config_cache()
 
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-
-    # Cancel scheduled job
-    if "cancel_daily_job" in entry_data:
-        try:
-            entry_data["cancel_daily_job"]()
-            _LOGGER.debug("Daily aggregation job cancelled")
-        except Exception as err:
-            _LOGGER.warning("Error cancelling daily job: %s", err)
+    # Drop a debounced config refresh that has not fired yet
+    pending_config_update = entry_data.get("pending_config_update")
+    if pending_config_update is not None:
+        pending_config_update.cancel()
 
     # Stop power sources collector
-    if "power_sources_collector" in entry_data and entry_data["power_sources_collector"]:
+    power_sources_collector = entry_data.get("power_sources_collector")
+    if power_sources_collector:
         try:
-            await entry_data["power_sources_collector"].stop()
+            await power_sources_collector.stop()
             _LOGGER.debug("Power sources collector stopped")
         except Exception as err:
             _LOGGER.warning("Error stopping power sources collector: %s", err)
 
     # Weather collector doesn't need stopping (passive loader)
     # Just log if it was present
-    if "weather_collector" in entry_data and entry_data["weather_collector"]:
+    if entry_data.get("weather_collector"):
         _LOGGER.debug("Weather collector cleaned up")
 
     # Dismiss persistent notification if it was created
@@ -260,30 +409,83 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception:
         pass  # Notification might not exist
 
-    # Clean up entry data
-    del hass.data[DOMAIN][entry.entry_id]
+    # Release the shared singletons once the last entry is gone, so a later
+    # setup re-validates the source integrations
+    domain_data = hass.data.get(DOMAIN, {})
+    if not any(not key.startswith("_") for key in domain_data):
+        for key in ("_validator", "_validator_init", "_aggregator"):
+            domain_data.pop(key, None)
 
     return True
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry. @zara"""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    """Reload config entry. @zara
 
+    Only needed when a structural key changed; plain option edits are
+    applied in place by _async_update_listener.
+    """
+    await hass.config_entries.async_reload(entry.entry_id)
 
-async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update - refresh cached config without full reload. @zara"""
-    _LOGGER.info("Config entry updated, refreshing cached configuration")
 
-    if entry.entry_id not in hass.data.get(DOMAIN, {}):
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle options update - debounce bursts of edits into one refresh. @zara"""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is None:
         _LOGGER.warning("Entry %s not found in hass.data, skipping update", entry.entry_id)
         return
 
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    new_config = dict(entry.data)
+    # HA also notifies on no-op saves; entry.data is only replaced when it changes
+    if entry.data is entry_data.get("config"):
+        _LOGGER.debug("Config entry data unchanged, skipping refresh")
+        return
+
+    pending = entry_data.get("pending_config_update")
+    if pending is not None:
+        pending.cancel()
+
+    entry_data["pending_config_update"] = hass.loop.call_later(
+        CONFIG_UPDATE_DEBOUNCE_SECONDS, _async_apply_config_update, hass, entry
+    )
+
+
+@callback
+def _async_apply_config_update(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Refresh cached config without full reload. @zara"""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is None:
+        _LOGGER.debug("Entry %s unloaded before config refresh", entry.entry_id)
+        return
+
+    entry_data.pop("pending_config_update", None)
+
+    old_config = entry_data.get("config", {})
+    new_config = entry.data
+
+    changed_keys = {
+        key for key in old_config.keys() | new_config.keys()
+        if old_config.get(key) != new_config.get(key)
+    }
+    if not changed_keys:
+        entry_data["config"] = new_config
+        invalidate_config_cache()
+        _LOGGER.debug("Config entry data unchanged, skipping refresh")
+        return
+
+    _LOGGER.info("Config entry updated, refreshing cached configuration")
+
+    structural_changes = changed_keys & STRUCTURAL_CONFIG_KEYS
+    if structural_changes:
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Structural configuration changed (%s), reloading entry",
+                ", ".join(sorted(structural_changes)),
+            )
+        hass.async_create_task(async_reload_entry(hass, entry))
+        return
 
     entry_data["config"] = new_config
+    invalidate_config_cache()
 
     # Update BillingCalculator
     if "billing_calculator" in entry_data and entry_data["billing_calculator"]:
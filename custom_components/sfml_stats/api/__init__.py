@@ -10,7 +10,7 @@
 """SFML Stats API module."""
 from __future__ import annotations
 
-from .views import async_setup_views
+from .views import async_setup_views, invalidate_config_cache
 from .websocket import async_setup_websocket
 
-__all__ = ["async_setup_views", "async_setup_websocket"]
+__all__ = ["async_setup_views", "async_setup_websocket", "invalidate_config_cache"]
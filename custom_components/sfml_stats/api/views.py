@@ -11,15 +11,23 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import functools
+import hashlib
+import importlib
 import ipaddress
-import json
+import itertools
 import logging
+import operator
+import time
+from collections import OrderedDict
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
+import orjson
 from aiohttp import web
+from ciso8601 import parse_datetime
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
 
@@ -41,15 +49,17 @@ LOCAL_NETWORKS = [
 
 def _get_client_ip(request: web.Request) -> str:
     """Extract real client IP from request. @zara"""
+    get_header = request.headers.get
+
     # Cloudflare specific header (highest priority)
-    cf_ip = request.headers.get("CF-Connecting-IP")
+    cf_ip = get_header("CF-Connecting-IP")
     if cf_ip:
         return cf_ip.strip()
 
-    # Standard proxy header
-    forwarded = request.headers.get("X-Forwarded-For")
+    # Standard proxy header; only the first hop is needed
+    forwarded = get_header("X-Forwarded-For")
     if forwarded:
-        return forwarded.split(",")[0].strip()
+        return forwarded.split(",", 1)[0].strip()
 
     # Direct connection
     peername = request.transport.get_extra_info("peername")
@@ -59,13 +69,44 @@ def _get_client_ip(request: web.Request) -> str:
     return "unknown"
 
 
+# LOCAL_NETWORKS per IP version as (network_int, netmask_int) pairs, so
+# membership is a plain integer AND instead of Network.__contains__
+_LOCAL_NETS_BY_VERSION = {
+    version: tuple(
+        (int(network.network_address), int(network.netmask))
+        for network in LOCAL_NETWORKS
+        if network.version == version
+    )
+    for version in (4, 6)
+}
+
+
+@functools.lru_cache(maxsize=1024)
 def _is_local_ip(ip_str: str) -> bool:
-    """Check if IP is in local network range. @zara"""
+    """Check if IP is in local network range. @zara
+
+    Cached per IP string: a home network has only a handful of clients and
+    the network list is static, so repeat checks skip ip_address() parsing.
+    """
     try:
         ip = ipaddress.ip_address(ip_str)
-        return any(ip in network for network in LOCAL_NETWORKS)
     except ValueError:
         return False
+    addr = int(ip)
+    for base, mask in _LOCAL_NETS_BY_VERSION[ip.version]:
+        if addr & mask == base:
+            return True
+    return False
+
+
+# Pre-encoded page returned to blocked (non-local) clients
+_ACCESS_DENIED_HTML = (
+    b"<!DOCTYPE html><html><head><title>Access Denied</title></head>"
+    b"<body style='font-family:sans-serif;text-align:center;padding:50px;'>"
+    b"<h1>403 - Access Denied</h1>"
+    b"<p>SFML Stats is only accessible from the local network.</p>"
+    b"</body></html>"
+)
 
 
 def local_only(func):
@@ -78,11 +119,7 @@ def local_only(func):
                 "Blocked external access from %s to %s", client_ip, request.path
             )
             return web.Response(
-                text="<!DOCTYPE html><html><head><title>Access Denied</title></head>"
-                "<body style='font-family:sans-serif;text-align:center;padding:50px;'>"
-                "<h1>403 - Access Denied</h1>"
-                "<p>SFML Stats is only accessible from the local network.</p>"
-                "</body></html>",
+                body=_ACCESS_DENIED_HTML,
                 status=403,
                 content_type="text/html"
             )
@@ -128,6 +165,7 @@ from ..const import (
     CONF_FEED_IN_TARIFF,
     DEFAULT_FEED_IN_TARIFF,
     CONF_PANEL_GROUP_NAMES,
+    SFML_STATS_CACHE,
 )
 from ..utils import get_json_cache, read_json_safe
 
@@ -136,6 +174,15 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Analytics PNG exports: (url slug, module in ..charts, chart class)
+_ANALYTICS_EXPORTS: tuple[tuple[str, str, str], ...] = (
+    ("solar", "solar_analytics", "SolarAnalyticsChart"),
+    ("battery", "battery_analytics", "BatteryAnalyticsChart"),
+    ("house", "house_analytics", "HouseAnalyticsChart"),
+    ("grid", "grid_analytics", "GridAnalyticsChart"),
+    ("weather", "weather_analytics", "WeatherAnalyticsChart"),
+)
+
 
 class APIContext:
     """Singleton context for API views. @zara
@@ -152,6 +199,8 @@ class APIContext:
         self.config_path = Path(hass.config.path())
         self.solar_path = self.config_path / "solar_forecast_ml"
         self.grid_path = self.config_path / "grid_price_monitor"
+        self.solar_stats_file = self.solar_path / "stats" / "daily_summaries.json"
+        self.grid_prices_file = self.grid_path / "data" / "price_cache.json"
 
     @classmethod
     def get(cls) -> "APIContext":
@@ -188,10 +237,13 @@ SOLAR_PATH: Path | None = None
 GRID_PATH: Path | None = None
 HASS: HomeAssistant | None = None
 
+# Dashboard page, loaded once in async_setup_views
+_INDEX_HTML: bytes | None = None
+
 
 async def async_setup_views(hass: HomeAssistant) -> None:
     """Register all API views. @zara"""
-    global SOLAR_PATH, GRID_PATH, HASS
+    global SOLAR_PATH, GRID_PATH, HASS, _INDEX_HTML
 
     # Initialize new APIContext
     ctx = APIContext.initialize(hass)
@@ -204,6 +256,8 @@ async def async_setup_views(hass: HomeAssistant) -> None:
 
     _LOGGER.debug("SFML Stats paths: Solar=%s, Grid=%s", ctx.solar_path, ctx.grid_path)
 
+    _INDEX_HTML = await hass.async_add_executor_job(_load_index_html, config_path)
+
     hass.http.register_view(HealthCheckView())
     hass.http.register_view(DashboardView())
     hass.http.register_view(TariffDashboardView())
@@ -215,13 +269,10 @@ async def async_setup_views(hass: HomeAssistant) -> None:
     hass.http.register_view(EnergyFlowView())
     hass.http.register_view(StatisticsView())
     hass.http.register_view(BillingDataView())
-    hass.http.register_view(ExportSolarAnalyticsView())
-    hass.http.register_view(ExportBatteryAnalyticsView())
-    hass.http.register_view(ExportHouseAnalyticsView())
-    hass.http.register_view(ExportGridAnalyticsView())
+    for slug, chart_module, chart_class in _ANALYTICS_EXPORTS:
+        hass.http.register_view(ExportAnalyticsView(slug, chart_module, chart_class))
     hass.http.register_view(WeatherHistoryView())
     hass.http.register_view(WeatherComparisonView())
-    hass.http.register_view(ExportWeatherAnalyticsView())
     hass.http.register_view(PowerSourcesHistoryView())
     hass.http.register_view(ExportPowerSourcesView())
     hass.http.register_view(EnergySourcesDailyStatsView())
@@ -243,24 +294,282 @@ async def async_setup_views(hass: HomeAssistant) -> None:
     _LOGGER.info("SFML Stats API views registered")
 
 
+def _load_index_html(config_path: Path) -> bytes:
+    """Read the built dashboard page, or the fallback page if missing. @zara"""
+    candidates = (
+        # Via hass.config.path() first (works in Docker), then via __file__
+        config_path / "custom_components" / "sfml_stats" / "frontend" / "dist" / "index.html",
+        Path(__file__).parent.parent / "frontend" / "dist" / "index.html",
+    )
+    for frontend_path in candidates:
+        try:
+            return frontend_path.read_bytes()
+        except OSError:
+            continue
+
+    _LOGGER.warning("Frontend build not found, serving fallback dashboard page")
+    return DashboardView._get_fallback_html()
+
+
+# JSON bodies below this size are sent uncompressed (not worth the CPU)
+_COMPRESS_MIN_SIZE = 1024
+
+
+def _json_response(data: Any, status: int = 200) -> web.Response:
+    """Serialize data with orjson into a JSON response. @zara
+
+    orjson serializes date/datetime natively (ISO 8601), so handlers can
+    pass datetime objects instead of pre-formatted strings. Non-string dict
+    keys are stringified like json.dumps does. Larger bodies are compressed
+    when the client accepts it.
+    """
+    body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    response = web.Response(
+        body=body,
+        status=status,
+        content_type="application/json",
+    )
+    if len(body) >= _COMPRESS_MIN_SIZE:
+        response.enable_compression()
+    return response
+
+
+def _parse_date(value: Any) -> date:
+    """Parse an ISO date, mapping missing or invalid values to date.min. @zara"""
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return date.min
+
+
+_TIMESTAMP_MIN = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse an ISO timestamp as aware datetime, invalid values sort first. @zara"""
+    try:
+        ts = parse_datetime(value)
+    except (TypeError, ValueError):
+        return _TIMESTAMP_MIN
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
+
+class _SortKeys:
+    """Pre-parsed sort keys of a row list, with bisect-based cutoff slicing. @zara
+
+    The source files are written in chronological order (either direction).
+    The order is detected once, so selecting the rows at or after a cutoff
+    is a binary search plus a slice that keeps the original row order.
+    Unsorted lists fall back to a linear filter.
+    """
+
+    __slots__ = ("keys", "_ascending_keys", "_order")
+
+    def __init__(self, keys: list[Any]) -> None:
+        """Initialize from parsed keys in file order. @zara"""
+        self.keys = keys
+        pairs = list(zip(keys, keys[1:]))
+        if all(a <= b for a, b in pairs):
+            self._order = 1
+            self._ascending_keys = keys
+        elif all(a >= b for a, b in pairs):
+            self._order = -1
+            self._ascending_keys = keys[::-1]
+        else:
+            self._order = 0
+            self._ascending_keys = []
+
+    def rows_since(self, rows: list[Any], cutoff: Any) -> list[Any]:
+        """Return the rows whose key is >= cutoff, in file order. @zara"""
+        if self._order == 0:
+            return [row for row, key in zip(rows, self.keys) if key >= cutoff]
+        count = len(self._ascending_keys) - bisect.bisect_left(self._ascending_keys, cutoff)
+        if self._order == 1:
+            return rows[len(rows) - count:]
+        return rows[:count]
+
+
+def _build_price_index(data: dict) -> dict[str, Any]:
+    """Pre-parse the price timestamps of a price file. @zara
+
+    by_date_hour maps the rows' own date/hour fields to the first such row
+    (EnergyFlowView); latest_by_hour maps the hour of the parsed timestamp
+    to the last such row in the file (RealtimeDataView).
+    """
+    prices = data.get("prices") or []
+    timestamps = [_parse_timestamp(p.get("timestamp")) for p in prices]
+    by_date_hour: dict[tuple[str, int], dict] = {}
+    latest_by_hour: dict[int, dict] = {}
+    for p, ts in zip(prices, timestamps):
+        price_date = p.get("date")
+        price_hour = p.get("hour")
+        if price_date and price_hour is not None:
+            by_date_hour.setdefault((price_date, price_hour), p)
+        if ts is not _TIMESTAMP_MIN:
+            latest_by_hour[ts.hour] = p
+    return {
+        "timestamps": _SortKeys(timestamps),
+        "by_date_hour": by_date_hour,
+        "latest_by_hour": latest_by_hour,
+    }
+
+
+def _build_collector_index(data: dict) -> dict[str, Any]:
+    """Pre-parse the data point timestamps of the power sources history. @zara"""
+    data_points = data.get("data_points") or []
+    return {
+        "timestamps": _SortKeys([_parse_timestamp(dp.get("timestamp")) for dp in data_points]),
+    }
+
+
+def _build_date_index(list_key: str) -> Callable[[dict], dict[str, Any]]:
+    """Return an index builder that pre-parses the "date" of each row. @zara"""
+    def _build(data: dict) -> dict[str, Any]:
+        rows = data.get(list_key) or []
+        return {"dates": _SortKeys([_parse_date(row.get("date")) for row in rows])}
+    return _build
+
+
+def _build_forecast_index(data: dict) -> dict[str, Any]:
+    """Pre-parse history dates and pre-build the solar API's history rows. @zara"""
+    history = data.get("history") or []
+    index = _build_date_index("history")(data)
+    # Same order as history, so the "dates" keys slice both lists alike
+    index["daily_rows"] = [
+        {
+            "date": h.get("date"),
+            "overall": {
+                "predicted_total_kwh": h.get("predicted_kwh", 0),
+                "actual_total_kwh": h.get("actual_kwh", 0),
+                "accuracy_percent": h.get("accuracy", 0),
+                "peak_kwh": (h.get("peak_power_w", 0) or 0) / 1000,
+            }
+        }
+        for h in history
+    ]
+    index["history_rows"] = [
+        {
+            "date": h.get("date"),
+            "predicted_kwh": h.get("predicted_kwh", 0),
+            "actual_kwh": h.get("actual_kwh", 0),
+            "accuracy": h.get("accuracy", 0),
+            "peak_power_w": h.get("peak_power_w"),
+            "peak_at": h.get("peak_at"),
+            "consumption_kwh": h.get("consumption_kwh", 0),
+            "production_hours": h.get("production_hours"),
+        }
+        for h in history
+    ]
+    # StatisticsView year view: first 365 days that have a measured value
+    index["statistics_history"] = [
+        h for h in itertools.islice(history, 365)
+        if h.get("actual_kwh") is not None or h.get("yield_kwh") is not None
+    ]
+    return index
+
+
+def _build_summaries_index(data: dict) -> dict[str, Any]:
+    """Pre-parse summary dates and map each date string to its summary. @zara"""
+    index = _build_date_index("summaries")(data)
+    by_date: dict[str, dict] = {}
+    for s in data.get("summaries") or []:
+        by_date.setdefault(s.get("date"), s)
+    index["by_date"] = by_date
+    return index
+
+
+# Per-file builders for derived lookup structures. They run once each time
+# a file is (re)loaded into the cache, so request handlers never re-parse
+# the same date strings. The rows themselves stay untouched because they
+# are returned to the frontend as-is; reshaped copies live in the index.
+_JSON_INDEX_BUILDERS: dict[str, Callable[[dict], dict[str, Any]]] = {
+    "price_cache.json": _build_price_index,
+    "price_history.json": _build_price_index,
+    "daily_forecasts.json": _build_forecast_index,
+    "daily_summaries.json": _build_summaries_index,
+    "power_sources_history.json": _build_collector_index,
+}
+
+# Parsed JSON files keyed by path: (st_mtime_ns, st_size, data, index).
+# The set of files read by the views is small and fixed, so no eviction
+# is needed. Cached data is shared between requests and must not be mutated.
+_JSON_CACHE: dict[Path, tuple[int, int, Any, dict[str, Any]]] = {}
+
+
 async def _read_json_file(path: Path | None) -> dict | None:
-    """Read a JSON file asynchronously. @zara"""
+    """Read a JSON file asynchronously, reusing the parsed data while unchanged. @zara"""
+    data, _ = await _read_json_file_indexed(path)
+    return data
+
+
+async def _skip_json_file() -> None:
+    """Stand-in for an optional _read_json_file inside asyncio.gather. @zara"""
+    return None
+
+
+async def _read_json_file_indexed(
+    path: Path | None,
+) -> tuple[dict | None, dict[str, Any]]:
+    """Read a JSON file together with its pre-built lookup index. @zara"""
     if path is None:
         _LOGGER.warning("Path is None - was async_setup_views called?")
-        return None
-    if not path.exists():
+        return None, {}
+    try:
+        st = await asyncio.to_thread(path.stat)
+    except FileNotFoundError:
         _LOGGER.debug("File not found: %s", path)
-        return None
+        _JSON_CACHE.pop(path, None)
+        return None, {}
+    except OSError as e:
+        _LOGGER.error("Error reading %s: %s", path, e)
+        return None, {}
+
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], cached[3]
+
     try:
-        import aiofiles
-        async with aiofiles.open(path, "r", encoding="utf-8") as f:
-            content = await f.read()
-            data = json.loads(content)
-            _LOGGER.debug("Successfully loaded: %s (%d bytes)", path, len(content))
-            return data
+        content = await asyncio.to_thread(path.read_bytes)
+        data = orjson.loads(content)
+        _LOGGER.debug("Successfully loaded: %s (%d bytes)", path, len(content))
+        builder = _JSON_INDEX_BUILDERS.get(path.name)
+        index = builder(data) if builder is not None and isinstance(data, dict) else {}
     except Exception as e:
         _LOGGER.error("Error reading %s: %s", path, e)
-        return None
+        return None, {}
+
+    _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, data, index)
+    return data, index
+
+
+# Health probes may poll aggressively; data file presence is re-checked at
+# most every few seconds, as (monotonic time, checks)
+_HEALTH_PATHS_TTL = 5.0
+_health_paths_cache: tuple[float, dict[str, bool]] | None = None
+
+
+def _health_path_checks_sync(ctx: APIContext) -> dict[str, bool]:
+    """Check the data directories and files in one executor hop. @zara"""
+    solar = ctx.solar_path.exists()
+    grid = ctx.grid_path.exists()
+    return {
+        "solar_data_available": solar,
+        "grid_data_available": grid,
+        "solar_stats_available": solar and ctx.solar_stats_file.exists(),
+        "grid_prices_available": grid and ctx.grid_prices_file.exists(),
+    }
+
+
+async def _get_health_path_checks(ctx: APIContext) -> dict[str, bool]:
+    """Return the data file checks, cached for _HEALTH_PATHS_TTL. @zara"""
+    global _health_paths_cache
+    now = time.monotonic()
+    cached = _health_paths_cache
+    if cached is not None and now - cached[0] < _HEALTH_PATHS_TTL:
+        return cached[1]
+    checks = await asyncio.to_thread(_health_path_checks_sync, ctx)
+    _health_paths_cache = (now, checks)
+    return checks
 
 
 class HealthCheckView(HomeAssistantView):
@@ -277,34 +586,31 @@ class HealthCheckView(HomeAssistantView):
     @local_only
     async def get(self, request: Request) -> Response:
         """Return health status. @zara"""
-        try:
-            ctx = APIContext.get()
+        # Checked up front: an uninitialized context is an expected state
+        # here, not an exception
+        if not APIContext.is_initialized():
+            return web.json_response(
+                {
+                    "status": "unhealthy",
+                    "version": VERSION,
+                    "error": "API context not initialized",
+                    "timestamp": datetime.now().isoformat(),
+                },
+                status=503,
+            )
+
+        ctx = APIContext.get()
 
+        try:
             # Check various health indicators
             checks = {
-                "solar_data_available": ctx.solar_path.exists(),
-                "grid_data_available": ctx.grid_path.exists(),
+                **await _get_health_path_checks(ctx),
                 "integration_loaded": DOMAIN in ctx.hass.data,
                 "config_entries_present": len(
                     ctx.hass.config_entries.async_entries(DOMAIN)
                 ) > 0,
             }
 
-            # Check for specific data files
-            if checks["solar_data_available"]:
-                checks["solar_stats_available"] = (
-                    ctx.solar_path / "stats" / "daily_summaries.json"
-                ).exists()
-            else:
-                checks["solar_stats_available"] = False
-
-            if checks["grid_data_available"]:
-                checks["grid_prices_available"] = (
-                    ctx.grid_path / "data" / "price_cache.json"
-                ).exists()
-            else:
-                checks["grid_prices_available"] = False
-
             # Determine overall health
             critical_checks = [
                 checks["integration_loaded"],
@@ -333,17 +639,6 @@ class HealthCheckView(HomeAssistantView):
                 status=status_code,
             )
 
-        except RuntimeError:
-            # APIContext not initialized
-            return web.json_response(
-                {
-                    "status": "unhealthy",
-                    "version": VERSION,
-                    "error": "API context not initialized",
-                    "timestamp": datetime.now().isoformat(),
-                },
-                status=503,
-            )
         except Exception as err:
             _LOGGER.error("Health check error: %s", err)
             return web.json_response(
@@ -357,6 +652,44 @@ class HealthCheckView(HomeAssistantView):
             )
 
 
+# Headers of the HTML pages: embeddable by the HA frontend only, never cached.
+# aiohttp copies them into each response, so sharing the dict is safe.
+_DASHBOARD_HEADERS: dict[str, str] = {
+    "X-Frame-Options": "SAMEORIGIN",
+    "Content-Security-Policy": "frame-ancestors 'self'",
+    "Cache-Control": "no-cache, no-store, must-revalidate",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+
+
+# Raw file bytes by path, as (mtime_ns, size, content); only re-read on change
+_FILE_BYTES_CACHE: dict[Path, tuple[int, int, bytes]] = {}
+
+
+async def _read_file_cached(path: Path) -> bytes | None:
+    """Read a file, reusing the previous content while it is unchanged. @zara
+
+    Returns None if the file does not exist.
+    """
+    try:
+        st = await asyncio.to_thread(path.stat)
+    except FileNotFoundError:
+        _FILE_BYTES_CACHE.pop(path, None)
+        return None
+
+    cached = _FILE_BYTES_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    content = await asyncio.to_thread(path.read_bytes)
+    _FILE_BYTES_CACHE[path] = (st.st_mtime_ns, st.st_size, content)
+    return content
+
+
+_TARIFF_HTML_PATH = Path(__file__).parent.parent / "frontend" / "dist" / "tariffs.html"
+
+
 class TariffDashboardView(HomeAssistantView):
     """Serves the monthly tariff management page. @zara"""
 
@@ -368,29 +701,19 @@ class TariffDashboardView(HomeAssistantView):
     @local_only
     async def get(self, request: Request) -> Response:
         """Return the tariffs HTML page. @zara"""
-        tariff_html_path = Path(__file__).parent.parent / "frontend" / "dist" / "tariffs.html"
-
-        if not tariff_html_path.exists():
-            return web.Response(
-                text="Tariff dashboard not found. Please check installation.",
-                status=404,
-                content_type="text/plain"
-            )
-
         try:
-            import aiofiles
-            async with aiofiles.open(tariff_html_path, "r", encoding="utf-8") as f:
-                html_content = await f.read()
+            html_content = await _read_file_cached(_TARIFF_HTML_PATH)
+            if html_content is None:
+                return web.Response(
+                    text="Tariff dashboard not found. Please check installation.",
+                    status=404,
+                    content_type="text/plain"
+                )
             return web.Response(
-                text=html_content,
+                body=html_content,
                 content_type="text/html",
-                headers={
-                    "X-Frame-Options": "SAMEORIGIN",
-                    "Content-Security-Policy": "frame-ancestors 'self'",
-                    "Cache-Control": "no-cache, no-store, must-revalidate",
-                    "Pragma": "no-cache",
-                    "Expires": "0",
-                }
+                charset="utf-8",
+                headers=_DASHBOARD_HEADERS,
             )
         except Exception as err:
             _LOGGER.error("Error loading tariff dashboard: %s", err)
@@ -401,51 +724,8 @@ class TariffDashboardView(HomeAssistantView):
             )
 
 
-class DashboardView(HomeAssistantView):
-    """Main view serving the Vue.js app. @zara"""
-
-    url = "/api/sfml_stats/dashboard"
-    name = "api:sfml_stats:dashboard"
-    requires_auth = False
-    cors_allowed = True
-
-    @local_only
-    async def get(self, request: Request) -> Response:
-        """Return the dashboard HTML page. @zara"""
-        frontend_path = None
-
-        # Try via hass.config.path() first (works in Docker)
-        if HASS is not None:
-            frontend_path = Path(HASS.config.path()) / "custom_components" / "sfml_stats" / "frontend" / "dist" / "index.html"
-            if not frontend_path.exists():
-                frontend_path = None
-
-        # Fallback via __file__
-        if frontend_path is None:
-            frontend_path = Path(__file__).parent.parent / "frontend" / "dist" / "index.html"
-
-        if not frontend_path.exists():
-            html_content = self._get_fallback_html()
-        else:
-            import aiofiles
-            async with aiofiles.open(frontend_path, "r", encoding="utf-8") as f:
-                html_content = await f.read()
-
-        return web.Response(
-            text=html_content,
-            content_type="text/html",
-            headers={
-                "X-Frame-Options": "SAMEORIGIN",
-                "Content-Security-Policy": "frame-ancestors 'self'",
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0",
-            }
-        )
-
-    def _get_fallback_html(self) -> str:
-        """Return fallback HTML when build is not present. @zara"""
-        return """<!DOCTYPE html>
+# Placeholder dashboard page served while the frontend build is missing
+_FALLBACK_HTML = b"""<!DOCTYPE html>
 <html>
 <head>
     <title>SFML Stats Dashboard</title>
@@ -474,6 +754,44 @@ class DashboardView(HomeAssistantView):
 </html>"""
 
 
+class DashboardView(HomeAssistantView):
+    """Main view serving the Vue.js app. @zara"""
+
+    url = "/api/sfml_stats/dashboard"
+    name = "api:sfml_stats:dashboard"
+    requires_auth = False
+    cors_allowed = True
+
+    @local_only
+    async def get(self, request: Request) -> Response:
+        """Return the dashboard HTML page. @zara"""
+        html_content = _INDEX_HTML
+        if html_content is None:
+            html_content = self._get_fallback_html()
+
+        return web.Response(
+            body=html_content,
+            content_type="text/html",
+            charset="utf-8",
+            headers=_DASHBOARD_HEADERS,
+        )
+
+    @staticmethod
+    def _get_fallback_html() -> bytes:
+        """Return fallback HTML when build is not present. @zara"""
+        return _FALLBACK_HTML
+
+
+# Content types of the frontend build assets, by file suffix
+_CTYPES: dict[str, str] = {
+    ".js": "application/javascript",
+    ".css": "text/css",
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+    ".woff2": "font/woff2",
+}
+
+
 class StaticFilesView(HomeAssistantView):
     """Serve static files (JS, CSS, Assets). @zara"""
 
@@ -500,23 +818,17 @@ class StaticFilesView(HomeAssistantView):
             _LOGGER.warning("Static file not found: %s", filename)
             return web.Response(status=404, text="Not found")
 
-        content_type = "application/octet-stream"
-        if filename.endswith(".js"):
-            content_type = "application/javascript"
-        elif filename.endswith(".css"):
-            content_type = "text/css"
-        elif filename.endswith(".svg"):
-            content_type = "image/svg+xml"
-        elif filename.endswith(".png"):
-            content_type = "image/png"
-        elif filename.endswith(".woff2"):
-            content_type = "font/woff2"
-
-        import aiofiles
-        async with aiofiles.open(frontend_path, "rb") as f:
-            content = await f.read()
+        content_type = _CTYPES.get(frontend_path.suffix.lower(), "application/octet-stream")
 
-        return web.Response(body=content, content_type=content_type)
+        # Streamed by aiohttp (sendfile where available) instead of buffered in memory.
+        # Build assets carry content hashes in their names, so they never change.
+        return web.FileResponse(
+            frontend_path,
+            headers={
+                "Content-Type": content_type,
+                "Cache-Control": "public, max-age=31536000, immutable",
+            },
+        )
 
 
 class SolarDataView(HomeAssistantView):
@@ -531,64 +843,68 @@ class SolarDataView(HomeAssistantView):
         """Return solar data. @zara"""
         days = int(request.query.get("days", 7))
         include_hourly = request.query.get("hourly", "true").lower() == "true"
+        now = datetime.now()
+        cutoff = now.date() - timedelta(days=days)
+        # "YYYY-MM-DD" sorts lexicographically, so date keys are compared as
+        # strings instead of parsing each one
+        cutoff_str = cutoff.isoformat()
 
         result = {
             "success": True,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "data": {},
         }
 
-        forecasts_data = await _read_json_file(SOLAR_PATH / "stats" / "daily_forecasts.json")
+        (
+            (forecasts_data, forecasts_index),
+            (summaries, summaries_index),
+            predictions,
+            weather,
+            weather_corrected,
+            ai_weights,
+            astronomy,
+            multi_day,
+        ) = await asyncio.gather(
+            _read_json_file_indexed(SOLAR_PATH / "stats" / "daily_forecasts.json"),
+            # Fallback for "daily"; read alongside so it never costs a second round trip
+            _read_json_file_indexed(SOLAR_PATH / "stats" / "daily_summaries.json"),
+            _read_json_file(SOLAR_PATH / "stats" / "hourly_predictions.json")
+            if include_hourly else _skip_json_file(),
+            _read_json_file(SOLAR_PATH / "stats" / "hourly_weather_actual.json"),
+            _read_json_file(SOLAR_PATH / "stats" / "weather_forecast_corrected.json"),
+            _read_json_file(SOLAR_PATH / "ai" / "learned_weights.json"),
+            _read_json_file(SOLAR_PATH / "stats" / "astronomy_cache.json"),
+            # Multi-day hourly forecast (Heute, Morgen, Übermorgen)
+            _read_json_file(SOLAR_PATH / "stats" / "multi_day_hourly_forecast.json"),
+        )
+
         if forecasts_data and "history" in forecasts_data and len(forecasts_data["history"]) > 0:
-            cutoff = date.today() - timedelta(days=days)
-            result["data"]["daily"] = [
-                {
-                    "date": h["date"],
-                    "overall": {
-                        "predicted_total_kwh": h.get("predicted_kwh", 0),
-                        "actual_total_kwh": h.get("actual_kwh", 0),
-                        "accuracy_percent": h.get("accuracy", 0),
-                        "peak_kwh": (h.get("peak_power_w", 0) or 0) / 1000,
-                    }
-                }
-                for h in forecasts_data["history"]
-                if date.fromisoformat(h["date"]) >= cutoff
-            ]
-        else:
-            summaries = await _read_json_file(SOLAR_PATH / "stats" / "daily_summaries.json")
-            if summaries and "summaries" in summaries:
-                cutoff = date.today() - timedelta(days=days)
-                result["data"]["daily"] = [
-                    s for s in summaries["summaries"]
-                    if date.fromisoformat(s["date"]) >= cutoff
-                ]
+            result["data"]["daily"] = forecasts_index["dates"].rows_since(
+                forecasts_index["daily_rows"], cutoff
+            )
+        elif summaries and "summaries" in summaries:
+            result["data"]["daily"] = summaries_index["dates"].rows_since(
+                summaries["summaries"], cutoff
+            )
 
-        if include_hourly:
-            predictions = await _read_json_file(SOLAR_PATH / "stats" / "hourly_predictions.json")
-            if predictions and "predictions" in predictions:
-                cutoff = date.today() - timedelta(days=days)
-                result["data"]["hourly"] = [
-                    p for p in predictions["predictions"]
-                    if date.fromisoformat(p.get("target_date", "1970-01-01")) >= cutoff
-                ]
+        if predictions and "predictions" in predictions:
+            result["data"]["hourly"] = [
+                p for p in predictions["predictions"]
+                if p.get("target_date", "1970-01-01") >= cutoff_str
+            ]
 
-        weather = await _read_json_file(SOLAR_PATH / "stats" / "hourly_weather_actual.json")
         if weather and "hourly_data" in weather:
-            cutoff = date.today() - timedelta(days=days)
             result["data"]["weather"] = {
                 k: v for k, v in weather["hourly_data"].items()
-                if date.fromisoformat(k) >= cutoff
+                if k >= cutoff_str
             }
 
-        weather_corrected = await _read_json_file(SOLAR_PATH / "stats" / "weather_forecast_corrected.json")
         if weather_corrected and "forecast" in weather_corrected:
-            cutoff = date.today() - timedelta(days=days)
             result["data"]["weather_corrected"] = {
                 k: v for k, v in weather_corrected["forecast"].items()
-                if date.fromisoformat(k) >= cutoff
+                if k >= cutoff_str
             }
 
-        ai_weights = await _read_json_file(SOLAR_PATH / "ai" / "learned_weights.json")
         if ai_weights:
             result["data"]["ai_state"] = ai_weights
 
@@ -614,26 +930,12 @@ class SolarDataView(HomeAssistantView):
             }
 
             if "history" in forecasts_data:
-                result["data"]["history"] = [
-                    {
-                        "date": h["date"],
-                        "predicted_kwh": h.get("predicted_kwh", 0),
-                        "actual_kwh": h.get("actual_kwh", 0),
-                        "accuracy": h.get("accuracy", 0),
-                        "peak_power_w": h.get("peak_power_w"),
-                        "peak_at": h.get("peak_at"),
-                        "consumption_kwh": h.get("consumption_kwh", 0),
-                        "production_hours": h.get("production_hours"),
-                    }
-                    for h in forecasts_data["history"]
-                ]
+                result["data"]["history"] = forecasts_index["history_rows"]
 
             if "statistics" in forecasts_data:
                 result["data"]["statistics"] = forecasts_data["statistics"]
 
-        astronomy = await _read_json_file(SOLAR_PATH / "stats" / "astronomy_cache.json")
         if astronomy and "days" in astronomy:
-            cutoff_str = (date.today() - timedelta(days=days)).isoformat()
             result["data"]["astronomy"] = {
                 k: {
                     "daylight_hours": v.get("daylight_hours"),
@@ -644,12 +946,10 @@ class SolarDataView(HomeAssistantView):
                 if k >= cutoff_str
             }
 
-        # Multi-day hourly forecast (Heute, Morgen, Übermorgen)
-        multi_day = await _read_json_file(SOLAR_PATH / "stats" / "multi_day_hourly_forecast.json")
         if multi_day and "days" in multi_day:
             result["data"]["multi_day_hourly"] = multi_day["days"]
 
-        return web.json_response(result)
+        return _json_response(result)
 
 
 class PriceDataView(HomeAssistantView):
@@ -663,16 +963,20 @@ class PriceDataView(HomeAssistantView):
     async def get(self, request: Request) -> Response:
         """Return price data. @zara"""
         days = int(request.query.get("days", 7))
+        now = datetime.now()
 
         result = {
             "success": True,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "data": {},
         }
 
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff = now.astimezone(timezone.utc) - timedelta(days=days)
 
-        price_cache = await _read_json_file(GRID_PATH / "data" / "price_cache.json")
+        (price_cache, price_cache_index), stats = await asyncio.gather(
+            _read_json_file_indexed(GRID_PATH / "data" / "price_cache.json"),
+            _read_json_file(GRID_PATH / "data" / "statistics.json"),
+        )
         if price_cache and "prices" in price_cache:
             result["data"]["prices"] = [
                 {
@@ -682,11 +986,12 @@ class PriceDataView(HomeAssistantView):
                     "price_net": p.get("price", p.get("price_net", 0)),
                     "price_total": p.get("total_price", 0),
                 }
-                for p in price_cache["prices"]
-                if datetime.fromisoformat(p["timestamp"].replace("Z", "+00:00")) >= cutoff
+                for p in price_cache_index["timestamps"].rows_since(price_cache["prices"], cutoff)
             ]
         else:
-            prices = await _read_json_file(GRID_PATH / "data" / "price_history.json")
+            prices, prices_index = await _read_json_file_indexed(
+                GRID_PATH / "data" / "price_history.json"
+            )
             if prices and "prices" in prices:
                 result["data"]["prices"] = [
                     {
@@ -696,15 +1001,13 @@ class PriceDataView(HomeAssistantView):
                         "price_net": p.get("price_net", 0),
                         "price_total": None,
                     }
-                    for p in prices["prices"]
-                    if datetime.fromisoformat(p["timestamp"].replace("Z", "+00:00")) >= cutoff
+                    for p in prices_index["timestamps"].rows_since(prices["prices"], cutoff)
                 ]
 
-        stats = await _read_json_file(GRID_PATH / "data" / "statistics.json")
         if stats:
             result["data"]["statistics"] = stats
 
-        return web.json_response(result)
+        return _json_response(result)
 
 
 class SummaryDataView(HomeAssistantView):
@@ -717,51 +1020,54 @@ class SummaryDataView(HomeAssistantView):
     @local_only
     async def get(self, request: Request) -> Response:
         """Return a summary for the dashboard. @zara"""
+        now = datetime.now()
+        today = now.date()
+        today_str = today.isoformat()
+
         result = {
             "success": True,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "kpis": {},
             "today": {},
             "week": {},
         }
 
-        summaries = await _read_json_file(SOLAR_PATH / "stats" / "daily_summaries.json")
-        today = date.today()
+        (summaries, summaries_index), prices, ai_weights, astronomy, forecasts = await asyncio.gather(
+            _read_json_file_indexed(SOLAR_PATH / "stats" / "daily_summaries.json"),
+            _read_json_file(GRID_PATH / "data" / "price_history.json"),
+            _read_json_file(SOLAR_PATH / "ai" / "learned_weights.json"),
+            _read_json_file(SOLAR_PATH / "stats" / "astronomy_cache.json"),
+            _read_json_file(SOLAR_PATH / "stats" / "daily_forecasts.json"),
+        )
         week_ago = today - timedelta(days=7)
 
         if summaries and "summaries" in summaries:
-            today_data = next(
-                (s for s in summaries["summaries"] if s["date"] == today.isoformat()),
-                None
-            )
+            today_data = summaries_index["by_date"].get(today_str)
             if today_data:
+                overall = today_data.get("overall", {})
                 result["today"] = {
-                    "production": today_data.get("overall", {}).get("actual_total_kwh", 0),
-                    "forecast": today_data.get("overall", {}).get("predicted_total_kwh", 0),
-                    "accuracy": today_data.get("overall", {}).get("accuracy_percent", 0),
-                    "peak_hour": today_data.get("overall", {}).get("peak_hour"),
-                    "peak_kwh": today_data.get("overall", {}).get("peak_kwh", 0),
+                    "production": overall.get("actual_total_kwh", 0),
+                    "forecast": overall.get("predicted_total_kwh", 0),
+                    "accuracy": overall.get("accuracy_percent", 0),
+                    "peak_hour": overall.get("peak_hour"),
+                    "peak_kwh": overall.get("peak_kwh", 0),
                 }
 
-            week_data = [
-                s for s in summaries["summaries"]
-                if date.fromisoformat(s["date"]) >= week_ago
-            ]
+            week_data = summaries_index["dates"].rows_since(summaries["summaries"], week_ago)
             if week_data:
+                total_production = total_forecast = total_accuracy = 0
+                for s in week_data:
+                    overall = s.get("overall", {})
+                    total_production += overall.get("actual_total_kwh", 0)
+                    total_forecast += overall.get("predicted_total_kwh", 0)
+                    total_accuracy += overall.get("accuracy_percent", 0)
                 result["week"] = {
-                    "total_production": sum(
-                        s.get("overall", {}).get("actual_total_kwh", 0) for s in week_data
-                    ),
-                    "total_forecast": sum(
-                        s.get("overall", {}).get("predicted_total_kwh", 0) for s in week_data
-                    ),
-                    "avg_accuracy": sum(
-                        s.get("overall", {}).get("accuracy_percent", 0) for s in week_data
-                    ) / len(week_data) if week_data else 0,
+                    "total_production": total_production,
+                    "total_forecast": total_forecast,
+                    "avg_accuracy": total_accuracy / len(week_data),
                     "days_count": len(week_data),
                 }
 
-        prices = await _read_json_file(GRID_PATH / "data" / "price_history.json")
         if prices and "prices" in prices:
             recent_prices = [p["price_net"] for p in prices["prices"][-48:] if p.get("price_net")]
             if recent_prices:
@@ -770,7 +1076,6 @@ class SummaryDataView(HomeAssistantView):
                 result["kpis"]["price_min"] = min(recent_prices)
                 result["kpis"]["price_max"] = max(recent_prices)
 
-        ai_weights = await _read_json_file(SOLAR_PATH / "ai" / "learned_weights.json")
         if ai_weights:
             result["kpis"]["ai_training_samples"] = ai_weights.get("training_samples", 0)
 
@@ -786,13 +1091,10 @@ class SummaryDataView(HomeAssistantView):
             except Exception:
                 return None
 
-        astronomy = await _read_json_file(SOLAR_PATH / "stats" / "astronomy_cache.json")
-        today_str = date.today().isoformat()
         today_astronomy = {}
         if astronomy and "days" in astronomy:
             today_astronomy = astronomy["days"].get(today_str, {})
 
-        forecasts = await _read_json_file(SOLAR_PATH / "stats" / "daily_forecasts.json")
         if forecasts and "today" in forecasts:
             production_time = forecasts["today"].get("production_time", {})
             start_time = production_time.get("start_time")
@@ -816,7 +1118,7 @@ class SummaryDataView(HomeAssistantView):
                 "sunset": extract_time(today_astronomy.get("sunset_local")),
             }
 
-        return web.json_response(result)
+        return _json_response(result)
 
 
 class RealtimeDataView(HomeAssistantView):
@@ -829,19 +1131,26 @@ class RealtimeDataView(HomeAssistantView):
     @local_only
     async def get(self, request: Request) -> Response:
         """Return current realtime data. @zara"""
+        now = datetime.now()
+        today_str = now.date().isoformat()
+
         result = {
             "success": True,
-            "timestamp": datetime.now().isoformat(),
-            "current_hour": datetime.now().hour,
+            "timestamp": now,
+            "current_hour": now.hour,
             "data": {},
         }
 
-        predictions = await _read_json_file(SOLAR_PATH / "stats" / "hourly_predictions.json")
+        predictions, (prices, prices_index), weather = await asyncio.gather(
+            _read_json_file(SOLAR_PATH / "stats" / "hourly_predictions.json"),
+            _read_json_file_indexed(GRID_PATH / "data" / "price_history.json"),
+            _read_json_file(SOLAR_PATH / "stats" / "hourly_weather_actual.json"),
+        )
+
         if predictions and "predictions" in predictions:
-            now = datetime.now()
             current = next(
                 (p for p in predictions["predictions"]
-                 if p.get("target_date") == now.date().isoformat()
+                 if p.get("target_date") == today_str
                  and p.get("target_hour") == now.hour),
                 None
             )
@@ -853,33 +1162,56 @@ class RealtimeDataView(HomeAssistantView):
                     "astronomy": current.get("astronomy", {}),
                 }
 
-        prices = await _read_json_file(GRID_PATH / "data" / "price_history.json")
         if prices and "prices" in prices:
-            now = datetime.now()
-            current_price = next(
-                (p for p in reversed(prices["prices"])
-                 if datetime.fromisoformat(p["timestamp"].replace("Z", "+00:00")).hour == now.hour),
-                None
-            )
+            # Last entry in the file whose timestamp falls in the current hour
+            current_price = prices_index["latest_by_hour"].get(now.hour)
             if current_price:
                 result["data"]["price"] = {
                     "current": current_price.get("price_net", 0),
                     "hour": current_price.get("hour"),
                 }
 
-        weather = await _read_json_file(SOLAR_PATH / "stats" / "hourly_weather_actual.json")
         if weather and "hourly_data" in weather:
-            today_str = date.today().isoformat()
-            hour_str = str(datetime.now().hour)
+            hour_str = str(now.hour)
             if today_str in weather["hourly_data"]:
                 current_weather = weather["hourly_data"][today_str].get(hour_str, {})
                 result["data"]["weather_actual"] = current_weather
 
-        return web.json_response(result)
+        return _json_response(result)
+
+
+# Config found by _get_config and the billing calculator found by
+# _get_billing_calculator, reused until invalidate_config_cache() is called
+_CONFIG_CACHE: dict[str, Any] | None = None
+_BILLING_CALCULATOR_CACHE: Any | None = None
+
+
+def invalidate_config_cache() -> None:
+    """Drop cached entry lookups after an entry is set up, updated or unloaded. @zara"""
+    global _CONFIG_CACHE, _BILLING_CALCULATOR_CACHE
+    _CONFIG_CACHE = None
+    _BILLING_CALCULATOR_CACHE = None
+
+
+def _get_billing_calculator() -> Any | None:
+    """Get the billing calculator of the first loaded config entry. @zara"""
+    global _BILLING_CALCULATOR_CACHE
+    if _BILLING_CALCULATOR_CACHE is not None or HASS is None:
+        return _BILLING_CALCULATOR_CACHE
+
+    for entry_data in HASS.data.get(DOMAIN, {}).values():
+        if isinstance(entry_data, dict) and "billing_calculator" in entry_data:
+            _BILLING_CALCULATOR_CACHE = entry_data["billing_calculator"]
+            break
+    return _BILLING_CALCULATOR_CACHE
 
 
 def _get_config() -> dict[str, Any]:
     """Get current configuration from the first config entry. @zara"""
+    global _CONFIG_CACHE
+    if _CONFIG_CACHE is not None:
+        return _CONFIG_CACHE
+
     if HASS is None:
         _LOGGER.debug("_get_config: HASS is None")
         return {}
@@ -890,24 +1222,21 @@ def _get_config() -> dict[str, Any]:
     for entry_id, entry_data in entries.items():
         if isinstance(entry_data, dict) and "config" in entry_data:
             _LOGGER.debug("_get_config: Found config in entry %s: %s", entry_id, entry_data["config"])
-            return entry_data["config"]
+            _CONFIG_CACHE = entry_data["config"]
+            return _CONFIG_CACHE
 
     config_entries = HASS.config_entries.async_entries(DOMAIN)
     if config_entries:
-        entry = config_entries[0]
-        _LOGGER.debug("_get_config: Fallback to ConfigEntry.data: %s", dict(entry.data))
-        return dict(entry.data)
+        config = dict(config_entries[0].data)
+        _LOGGER.debug("_get_config: Fallback to ConfigEntry.data: %s", config)
+        return config
 
     _LOGGER.debug("_get_config: No config found")
     return {}
 
 
-def _get_sensor_value(entity_id: str | None) -> float | None:
-    """Read current value from a sensor. @zara"""
-    if not entity_id or not HASS:
-        return None
-
-    state = HASS.states.get(entity_id)
+def _state_to_float(state: Any) -> float | None:
+    """Convert a state object to a float, None if unavailable. @zara"""
     if state is None or state.state in ("unknown", "unavailable"):
         return None
 
@@ -917,6 +1246,27 @@ def _get_sensor_value(entity_id: str | None) -> float | None:
         return None
 
 
+def _get_sensor_value(entity_id: str | None) -> float | None:
+    """Read current value from a sensor. @zara"""
+    if not entity_id or not HASS:
+        return None
+
+    return _state_to_float(HASS.states.get(entity_id))
+
+
+def _get_sensor_values(config: dict[str, Any], sensors: dict[str, str]) -> dict[str, float | None]:
+    """Read several sensors in one pass, keyed like the sensors mapping. @zara"""
+    if not HASS:
+        return dict.fromkeys(sensors)
+
+    get_state = HASS.states.get
+    values: dict[str, float | None] = {}
+    for key, conf_key in sensors.items():
+        entity_id = config.get(conf_key)
+        values[key] = _state_to_float(get_state(entity_id)) if entity_id else None
+    return values
+
+
 def _get_weather_data(entity_id: str | None) -> dict[str, Any] | None:
     """Read weather data from a Home Assistant weather entity. @zara"""
     if not entity_id or not HASS:
@@ -940,6 +1290,47 @@ def _get_weather_data(entity_id: str | None) -> dict[str, Any] | None:
     }
 
 
+# Cardinal direction per half degree of azimuth. The sector borders lie on
+# half degrees (22.5 + n * 45), so this resolution is exact. The extra last
+# entry covers float rounding of azimuth % 360 up to 360.0.
+_AZIMUTH_DIRECTIONS: tuple[str, ...] = tuple(
+    ("N", "NE", "E", "SE", "S", "SW", "W", "NW")[int((half / 2 + 22.5) / 45) % 8]
+    for half in range(721)
+)
+
+# Sensors read by EnergyFlowView, keyed by their local name
+_ENERGY_FLOW_SENSORS: dict[str, str] = {
+    "solar_power": CONF_SENSOR_SOLAR_POWER,
+    "solar_to_house": CONF_SENSOR_SOLAR_TO_HOUSE,
+    "solar_to_battery": CONF_SENSOR_SOLAR_TO_BATTERY,
+    "grid_to_house": CONF_SENSOR_GRID_TO_HOUSE,
+    "house_to_grid": CONF_SENSOR_HOUSE_TO_GRID,
+    "home_consumption": CONF_SENSOR_HOME_CONSUMPTION,
+    "solar_yield_daily": CONF_SENSOR_SOLAR_YIELD_DAILY,
+    "grid_import_daily": CONF_SENSOR_GRID_IMPORT_DAILY,
+    "grid_import_yearly": CONF_SENSOR_GRID_IMPORT_YEARLY,
+    "battery_charge_solar_daily": CONF_SENSOR_BATTERY_CHARGE_SOLAR_DAILY,
+    "battery_charge_grid_daily": CONF_SENSOR_BATTERY_CHARGE_GRID_DAILY,
+    "price_total": CONF_SENSOR_PRICE_TOTAL,
+}
+
+# Panels shown in the energy flow: (id, name key, default name, power sensor, max today sensor)
+_PANEL_SPECS: tuple[tuple[int, str, str, str, str], ...] = (
+    (1, CONF_PANEL1_NAME, DEFAULT_PANEL1_NAME, CONF_SENSOR_PANEL1_POWER, CONF_SENSOR_PANEL1_MAX_TODAY),
+    (2, CONF_PANEL2_NAME, DEFAULT_PANEL2_NAME, CONF_SENSOR_PANEL2_POWER, CONF_SENSOR_PANEL2_MAX_TODAY),
+    (3, CONF_PANEL3_NAME, DEFAULT_PANEL3_NAME, CONF_SENSOR_PANEL3_POWER, CONF_SENSOR_PANEL3_MAX_TODAY),
+    (4, CONF_PANEL4_NAME, DEFAULT_PANEL4_NAME, CONF_SENSOR_PANEL4_POWER, CONF_SENSOR_PANEL4_MAX_TODAY),
+)
+
+# Battery sensors, only read when a battery SOC sensor is configured
+_ENERGY_FLOW_BATTERY_SENSORS: dict[str, str] = {
+    "battery_soc": CONF_SENSOR_BATTERY_SOC,
+    "battery_power": CONF_SENSOR_BATTERY_POWER,
+    "battery_to_house": CONF_SENSOR_BATTERY_TO_HOUSE,
+    "grid_to_battery": CONF_SENSOR_GRID_TO_BATTERY,
+}
+
+
 class EnergyFlowView(HomeAssistantView):
     """API for energy flow data from Home Assistant sensors. @zara"""
 
@@ -951,11 +1342,13 @@ class EnergyFlowView(HomeAssistantView):
     async def get(self, request: Request) -> Response:
         """Return current energy flow data. @zara"""
         config = _get_config()
+        values = _get_sensor_values(config, _ENERGY_FLOW_SENSORS)
+        now = datetime.now()
 
         # Solar kann NIEMALS negativ sein - korrigiere negative Werte
-        solar_power = _get_sensor_value(config.get(CONF_SENSOR_SOLAR_POWER))
-        solar_to_house = _get_sensor_value(config.get(CONF_SENSOR_SOLAR_TO_HOUSE))
-        solar_to_battery = _get_sensor_value(config.get(CONF_SENSOR_SOLAR_TO_BATTERY))
+        solar_power = values["solar_power"]
+        solar_to_house = values["solar_to_house"]
+        solar_to_battery = values["solar_to_battery"]
         if solar_power is not None and solar_power < 0:
             solar_power = 0.0
         if solar_to_house is not None and solar_to_house < 0:
@@ -977,41 +1370,43 @@ class EnergyFlowView(HomeAssistantView):
 
         # Prüfe ob Batterie konfiguriert ist (battery_soc ist der Haupt-Indikator)
         battery_configured = config.get(CONF_SENSOR_BATTERY_SOC) is not None
-        battery_soc = _get_sensor_value(config.get(CONF_SENSOR_BATTERY_SOC)) if battery_configured else None
-        battery_power = _get_sensor_value(config.get(CONF_SENSOR_BATTERY_POWER)) if battery_configured else None
-        battery_to_house = _get_sensor_value(config.get(CONF_SENSOR_BATTERY_TO_HOUSE)) if battery_configured else None
-        grid_to_battery = _get_sensor_value(config.get(CONF_SENSOR_GRID_TO_BATTERY)) if battery_configured else None
-
-        # Wenn keine Batterie konfiguriert, auch solar_to_battery auf None setzen
-        if not battery_configured:
+        if battery_configured:
+            battery = _get_sensor_values(config, _ENERGY_FLOW_BATTERY_SENSORS)
+        else:
+            battery = dict.fromkeys(_ENERGY_FLOW_BATTERY_SENSORS)
+            # Wenn keine Batterie konfiguriert, auch solar_to_battery auf None setzen
             solar_to_battery = None
 
+        sun_position, current_price = await asyncio.gather(
+            self._get_sun_position(now), self._get_current_price(now)
+        )
+
         result = {
             "success": True,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "flows": {
                 "solar_power": solar_power,
                 "solar_to_house": solar_to_house,
                 "solar_to_battery": solar_to_battery,
-                "battery_to_house": battery_to_house,
-                "grid_to_house": _get_sensor_value(config.get(CONF_SENSOR_GRID_TO_HOUSE)),
-                "grid_to_battery": grid_to_battery,
-                "house_to_grid": _get_sensor_value(config.get(CONF_SENSOR_HOUSE_TO_GRID)),
+                "battery_to_house": battery["battery_to_house"],
+                "grid_to_house": values["grid_to_house"],
+                "grid_to_battery": battery["grid_to_battery"],
+                "house_to_grid": values["house_to_grid"],
             },
             "battery": {
-                "soc": battery_soc,
-                "power": battery_power,
+                "soc": battery["battery_soc"],
+                "power": battery["battery_power"],
             },
             "home": {
-                "consumption": _get_sensor_value(config.get(CONF_SENSOR_HOME_CONSUMPTION)),
+                "consumption": values["home_consumption"],
             },
             "statistics": {
-                "solar_yield_daily": _get_sensor_value(config.get(CONF_SENSOR_SOLAR_YIELD_DAILY)),
-                "grid_import_daily": _get_sensor_value(config.get(CONF_SENSOR_GRID_IMPORT_DAILY)),
-                "grid_import_yearly": _get_sensor_value(config.get(CONF_SENSOR_GRID_IMPORT_YEARLY)),
-                "battery_charge_solar_daily": _get_sensor_value(config.get(CONF_SENSOR_BATTERY_CHARGE_SOLAR_DAILY)),
-                "battery_charge_grid_daily": _get_sensor_value(config.get(CONF_SENSOR_BATTERY_CHARGE_GRID_DAILY)),
-                "price_total": _get_sensor_value(config.get(CONF_SENSOR_PRICE_TOTAL)),
+                "solar_yield_daily": values["solar_yield_daily"],
+                "grid_import_daily": values["grid_import_daily"],
+                "grid_import_yearly": values["grid_import_yearly"],
+                "battery_charge_solar_daily": values["battery_charge_solar_daily"],
+                "battery_charge_grid_daily": values["battery_charge_grid_daily"],
+                "price_total": values["price_total"],
             },
             "configured_sensors": {
                 "solar_power": config.get(CONF_SENSOR_SOLAR_POWER),
@@ -1028,43 +1423,45 @@ class EnergyFlowView(HomeAssistantView):
             },
             "panels": self._get_panel_data(config),
             "weather_ha": _get_weather_data(config.get(CONF_WEATHER_ENTITY)),
-            "sun_position": await self._get_sun_position(),
-            "current_price": await self._get_current_price(),
+            "sun_position": sun_position,
+            "current_price": current_price,
             "feed_in_tariff": config.get(CONF_FEED_IN_TARIFF, DEFAULT_FEED_IN_TARIFF),
         }
 
-        return web.json_response(result)
+        return _json_response(result)
 
-    async def _get_current_price(self) -> dict[str, Any] | None:
+    async def _get_current_price(self, now: datetime) -> dict[str, Any] | None:
         """Read current electricity price from price_cache.json. @zara"""
-        price_cache = await _read_json_file(GRID_PATH / "data" / "price_cache.json")
+        price_cache, price_cache_index = await _read_json_file_indexed(
+            GRID_PATH / "data" / "price_cache.json"
+        )
         if not price_cache or "prices" not in price_cache:
             return None
 
-        today_str = date.today().isoformat()
-        current_hour = datetime.now().hour
+        today_str = now.date().isoformat()
+        current_hour = now.hour
 
-        for p in price_cache["prices"]:
-            if p.get("date") == today_str and p.get("hour") == current_hour:
-                return {
-                    "total_price": p.get("total_price"),
-                    "net_price": p.get("price"),
-                    "hour": current_hour,
-                }
-        return None
+        p = price_cache_index["by_date_hour"].get((today_str, current_hour))
+        if p is None:
+            return None
+        return {
+            "total_price": p.get("total_price"),
+            "net_price": p.get("price"),
+            "hour": current_hour,
+        }
 
-    async def _get_sun_position(self) -> dict[str, Any] | None:
+    async def _get_sun_position(self, now: datetime) -> dict[str, Any] | None:
         """Read current sun position from astronomy_cache.json. @zara"""
         astronomy = await _read_json_file(SOLAR_PATH / "stats" / "astronomy_cache.json")
         if not astronomy or "days" not in astronomy:
             return None
 
-        today_str = date.today().isoformat()
+        today_str = now.date().isoformat()
         today_data = astronomy["days"].get(today_str)
         if not today_data:
             return None
 
-        current_hour = datetime.now().hour
+        current_hour = now.hour
         hourly = today_data.get("hourly", {})
         current_hourly = hourly.get(str(current_hour), {})
 
@@ -1085,10 +1482,7 @@ class EnergyFlowView(HomeAssistantView):
         """Convert azimuth degrees to cardinal direction. @zara"""
         if azimuth is None:
             return "—"
-        azimuth = azimuth % 360
-        directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-        index = int((azimuth + 22.5) / 45) % 8
-        return directions[index]
+        return _AZIMUTH_DIRECTIONS[int(azimuth % 360 * 2)]
 
     def _extract_time(self, iso_string: str | None) -> str | None:
         """Extract HH:MM from ISO string. @zara"""
@@ -1104,41 +1498,16 @@ class EnergyFlowView(HomeAssistantView):
 
     def _get_panel_data(self, config: dict[str, Any]) -> list[dict[str, Any]]:
         """Read panel data from configured sensors. @zara"""
-        panels = []
-
-        if config.get(CONF_SENSOR_PANEL1_POWER):
-            panels.append({
-                "id": 1,
-                "name": config.get(CONF_PANEL1_NAME, DEFAULT_PANEL1_NAME),
-                "power": _get_sensor_value(config.get(CONF_SENSOR_PANEL1_POWER)),
-                "max_today": _get_sensor_value(config.get(CONF_SENSOR_PANEL1_MAX_TODAY)),
-            })
-
-        if config.get(CONF_SENSOR_PANEL2_POWER):
-            panels.append({
-                "id": 2,
-                "name": config.get(CONF_PANEL2_NAME, DEFAULT_PANEL2_NAME),
-                "power": _get_sensor_value(config.get(CONF_SENSOR_PANEL2_POWER)),
-                "max_today": _get_sensor_value(config.get(CONF_SENSOR_PANEL2_MAX_TODAY)),
-            })
-
-        if config.get(CONF_SENSOR_PANEL3_POWER):
-            panels.append({
-                "id": 3,
-                "name": config.get(CONF_PANEL3_NAME, DEFAULT_PANEL3_NAME),
-                "power": _get_sensor_value(config.get(CONF_SENSOR_PANEL3_POWER)),
-                "max_today": _get_sensor_value(config.get(CONF_SENSOR_PANEL3_MAX_TODAY)),
-            })
-
-        if config.get(CONF_SENSOR_PANEL4_POWER):
-            panels.append({
-                "id": 4,
-                "name": config.get(CONF_PANEL4_NAME, DEFAULT_PANEL4_NAME),
-                "power": _get_sensor_value(config.get(CONF_SENSOR_PANEL4_POWER)),
-                "max_today": _get_sensor_value(config.get(CONF_SENSOR_PANEL4_MAX_TODAY)),
-            })
-
-        return panels
+        return [
+            {
+                "id": panel_id,
+                "name": config.get(name_key, default_name),
+                "power": _get_sensor_value(config.get(power_key)),
+                "max_today": _get_sensor_value(config.get(max_today_key)),
+            }
+            for panel_id, name_key, default_name, power_key, max_today_key in _PANEL_SPECS
+            if config.get(power_key)
+        ]
 
 
 class StatisticsView(HomeAssistantView):
@@ -1148,6 +1517,14 @@ class StatisticsView(HomeAssistantView):
     name = "api:sfml_stats:statistics"
     requires_auth = False
 
+    def __init__(self) -> None:
+        """Initialize the view. @zara"""
+        # (date, predictions data, group name mapping, panel groups) of the
+        # last build. The JSON cache returns the same predictions object while
+        # the file is unchanged, so an identity check covers the data; the
+        # name mapping (the only config input) is compared by value.
+        self._panel_group_cache: tuple[str, Any, Any, dict[str, Any]] | None = None
+
     @local_only
     async def get(self, request: Request) -> Response:
         """Return statistics data from Solar Forecast ML JSON files. @zara"""
@@ -1160,7 +1537,21 @@ class StatisticsView(HomeAssistantView):
             "statistics": {},
         }
 
-        forecasts = await _read_json_file(SOLAR_PATH / "stats" / "daily_forecasts.json")
+        (forecasts, forecasts_index), predictions = await asyncio.gather(
+            _read_json_file_indexed(SOLAR_PATH / "stats" / "daily_forecasts.json"),
+            _read_json_file(SOLAR_PATH / "stats" / "hourly_predictions.json"),
+        )
+
+        today_str = date.today().isoformat()
+        today_preds = []
+        if predictions and "predictions" in predictions:
+            today_preds = [
+                p for p in predictions["predictions"]
+                if p.get("target_date") == today_str
+            ]
+            # Hour order, so the per-group hourly lists come out sorted
+            today_preds.sort(key=lambda p: p.get("target_hour") or 0)
+
         if forecasts:
             today_data = forecasts.get("today", {})
             peak_today = today_data.get("peak_today", {})
@@ -1190,20 +1581,14 @@ class StatisticsView(HomeAssistantView):
                 "forecast_kwh_display": forecast_tomorrow_data.get("prediction_kwh_display"),
             }
 
-            predictions = await _read_json_file(SOLAR_PATH / "stats" / "hourly_predictions.json")
             result["best_hour"] = {"hour": None, "prediction_kwh": None}
-            if predictions and "predictions" in predictions:
-                today_str = date.today().isoformat()
-                today_preds = [
-                    p for p in predictions["predictions"]
-                    if p.get("target_date") == today_str and p.get("prediction_kwh")
-                ]
-                if today_preds:
-                    best = max(today_preds, key=lambda x: x.get("prediction_kwh", 0))
-                    result["best_hour"] = {
-                        "hour": best.get("target_hour"),
-                        "prediction_kwh": best.get("prediction_kwh"),
-                    }
+            producing_preds = [p for p in today_preds if p.get("prediction_kwh")]
+            if producing_preds:
+                best = max(producing_preds, key=operator.itemgetter("prediction_kwh"))
+                result["best_hour"] = {
+                    "hour": best.get("target_hour"),
+                    "prediction_kwh": best.get("prediction_kwh"),
+                }
 
             result["statistics"]["current_week"] = stats.get("current_week", {})
             result["statistics"]["current_month"] = stats.get("current_month", {})
@@ -1211,89 +1596,91 @@ class StatisticsView(HomeAssistantView):
             result["statistics"]["last_30_days"] = stats.get("last_30_days", {})
             result["statistics"]["last_365_days"] = stats.get("last_365_days", {})
 
-            history = forecasts.get("history", [])
-            result["history"] = [
-                h for h in history[:365]  # Return up to 365 days for year view
-                if h.get("actual_kwh") is not None or h.get("yield_kwh") is not None
-            ]
-
-        result["panel_groups"] = await self._get_panel_group_data()
-
-        return web.json_response(result)
+            result["history"] = forecasts_index["statistics_history"]
 
-    async def _get_panel_group_data(self) -> dict[str, Any]:
-        """Extract panel group predictions and actuals for today. @zara"""
-        predictions = await _read_json_file(SOLAR_PATH / "stats" / "hourly_predictions.json")
-        if not predictions or "predictions" not in predictions:
-            return {"available": False, "groups": {}}
+        name_mapping = _get_config().get(CONF_PANEL_GROUP_NAMES)
+        if not isinstance(name_mapping, dict):
+            name_mapping = {}
+        cached = self._panel_group_cache
+        if (
+            cached is not None
+            and cached[0] == today_str
+            and cached[1] is predictions
+            and cached[2] == name_mapping
+        ):
+            result["panel_groups"] = cached[3]
+        else:
+            panel_groups = await self._get_panel_group_data(today_preds, today_str, name_mapping)
+            # Snapshot the mapping so an in-place config edit is still noticed
+            self._panel_group_cache = (today_str, predictions, dict(name_mapping), panel_groups)
+            result["panel_groups"] = panel_groups
 
-        today_str = date.today().isoformat()
-        today_preds = [
-            p for p in predictions["predictions"]
-            if p.get("target_date") == today_str
-        ]
+        return _json_response(result)
 
+    async def _get_panel_group_data(
+        self, today_preds: list[dict[str, Any]], today_str: str, name_mapping: dict[str, str]
+    ) -> dict[str, Any]:
+        """Extract panel group predictions and actuals from today's hourly predictions. @zara"""
         if not today_preds:
             return {"available": False, "groups": {}}
 
         group_names = set()
         for p in today_preds:
-            if p.get("panel_group_predictions"):
-                group_names.update(p["panel_group_predictions"].keys())
-            if p.get("panel_group_actuals"):
-                group_names.update(p["panel_group_actuals"].keys())
+            group_preds = p.get("panel_group_predictions")
+            if group_preds:
+                group_names.update(group_preds)
+            group_actuals = p.get("panel_group_actuals")
+            if group_actuals:
+                group_names.update(group_actuals)
 
         if not group_names:
             return {"available": False, "groups": {}}
 
-        # Get panel group name mapping from config
-        config = _get_config()
-        name_mapping = config.get(CONF_PANEL_GROUP_NAMES, {})
-        if not isinstance(name_mapping, dict):
-            name_mapping = {}
-
-        groups = {}
-        for group_name in sorted(group_names):
-            # Apply name mapping: use custom name if configured, otherwise original name
-            display_name = name_mapping.get(group_name, group_name)
-
-            group_data = {
-                "name": display_name,
-                "original_name": group_name,  # Keep original for reference
-                "prediction_total_kwh": 0.0,
-                "actual_total_kwh": 0.0,
-                "hourly": [],
-            }
+        # Accumulators in sorted group order. Every group gets one hourly slot
+        # per prediction row, so all names must be known before the pass.
+        accumulators = {
+            group_name: {"prediction_total_kwh": 0.0, "actual_total_kwh": 0.0, "hourly": []}
+            for group_name in sorted(group_names)
+        }
 
-            for p in today_preds:
-                hour = p.get("target_hour")
-                pred_kwh = None
-                actual_kwh = None
+        for p in today_preds:
+            hour = p.get("target_hour")
+            group_preds = p.get("panel_group_predictions") or {}
+            group_actuals = p.get("panel_group_actuals") or {}
 
-                if p.get("panel_group_predictions"):
-                    pred_kwh = p["panel_group_predictions"].get(group_name)
-                if p.get("panel_group_actuals"):
-                    actual_kwh = p["panel_group_actuals"].get(group_name)
+            for group_name, acc in accumulators.items():
+                pred_kwh = group_preds.get(group_name)
+                actual_kwh = group_actuals.get(group_name)
 
                 if pred_kwh is not None:
-                    group_data["prediction_total_kwh"] += pred_kwh
+                    acc["prediction_total_kwh"] += pred_kwh
                 if actual_kwh is not None:
-                    group_data["actual_total_kwh"] += actual_kwh
+                    acc["actual_total_kwh"] += actual_kwh
 
-                group_data["hourly"].append({
+                acc["hourly"].append({
                     "hour": hour,
                     "prediction_kwh": pred_kwh,
                     "actual_kwh": actual_kwh,
                 })
 
+        groups = {}
+        for group_name, acc in accumulators.items():
+            # Apply name mapping: use custom name if configured, otherwise original name
+            display_name = name_mapping.get(group_name, group_name)
+
+            group_data = {
+                "name": display_name,
+                "original_name": group_name,  # Keep original for reference
+                **acc,
+            }
+
             # Calculate accuracy: 100% - |deviation%|
             # Accuracy can never be >100% or <0%
-            if group_data["prediction_total_kwh"] > 0 and group_data["actual_total_kwh"] > 0:
-                deviation_percent = abs(
-                    (group_data["actual_total_kwh"] - group_data["prediction_total_kwh"])
-                    / group_data["prediction_total_kwh"]
-                ) * 100
-                group_data["accuracy_percent"] = max(0, min(100, 100 - deviation_percent))
+            pred_total = acc["prediction_total_kwh"]
+            actual_total = acc["actual_total_kwh"]
+            if pred_total > 0 and actual_total > 0:
+                deviation_percent = abs(actual_total - pred_total) / pred_total * 100.0
+                group_data["accuracy_percent"] = max(0.0, min(100.0, 100.0 - deviation_percent))
             else:
                 group_data["accuracy_percent"] = None
 
@@ -1314,9 +1701,7 @@ class StatisticsView(HomeAssistantView):
                 "last_updated": datetime.now().isoformat(),
                 **data
             }
-            import aiofiles
-            async with aiofiles.open(cache_path, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(cache_data, indent=2))
+            await asyncio.to_thread(cache_path.write_bytes, orjson.dumps(cache_data))
         except Exception as e:
             _LOGGER.warning("Failed to save panel group cache: %s", e)
 
@@ -1337,13 +1722,7 @@ class BillingDataView(HomeAssistantView):
                 "error": "Home Assistant not initialized",
             })
 
-        billing_calculator = None
-        entries = HASS.data.get(DOMAIN, {})
-        for entry_id, entry_data in entries.items():
-            if isinstance(entry_data, dict) and "billing_calculator" in entry_data:
-                billing_calculator = entry_data["billing_calculator"]
-                break
-
+        billing_calculator = _get_billing_calculator()
         if billing_calculator is None:
             return web.json_response({
                 "success": False,
@@ -1359,33 +1738,50 @@ class BillingDataView(HomeAssistantView):
                 "error": str(err),
             })
 
-        return web.json_response(billing_data)
+        return _json_response(billing_data)
 
 
-class ExportSolarAnalyticsView(HomeAssistantView):
-    """View to export solar analytics as PNG (Matplotlib)."""
+class ExportAnalyticsView(HomeAssistantView):
+    """View to export an analytics chart as PNG (Matplotlib). @zara
+
+    One instance is registered per chart; the chart class is imported on
+    first use and kept on the instance.
+    """
 
-    url = "/api/sfml_stats/export_solar_analytics"
-    name = "api:sfml_stats:export_solar_analytics"
     requires_auth = False
 
+    def __init__(self, slug: str, chart_module: str, chart_class: str) -> None:
+        """Initialize the view for one chart. @zara"""
+        self.url = f"/api/sfml_stats/export_{slug}_analytics"
+        self.name = f"api:sfml_stats:export_{slug}_analytics"
+        self._slug = slug
+        self._chart_module = chart_module
+        self._chart_class = chart_class
+        self._chart_cls: type | None = None
+
     @local_only
     async def post(self, request: web.Request) -> web.Response:
-        """Generate and return solar analytics PNG."""
+        """Generate and return the analytics PNG. @zara"""
         try:
             # Parse request JSON
-            data = await request.json()
+            data = orjson.loads(await request.read())
             period = data.get("period", "week")
             stats = data.get("stats", {})
             history = data.get("data", [])
 
-            _LOGGER.info("Generating solar analytics export: period=%s, data_points=%d", period, len(history))
+            _LOGGER.info(
+                "Generating %s analytics export: period=%s, data_points=%d",
+                self._slug, period, len(history),
+            )
 
             # Import chart class
-            from ..charts.solar_analytics import SolarAnalyticsChart
+            chart_cls = self._chart_cls
+            if chart_cls is None:
+                module = importlib.import_module(f"..charts.{self._chart_module}", __package__)
+                chart_cls = self._chart_cls = getattr(module, self._chart_class)
 
             # Generate chart
-            chart = SolarAnalyticsChart(
+            chart = chart_cls(
                 period=period,
                 stats=stats,
                 data=history
@@ -1399,144 +1795,12 @@ class ExportSolarAnalyticsView(HomeAssistantView):
                 body=png_bytes,
                 content_type="image/png",
                 headers={
-                    "Content-Disposition": f'attachment; filename="solar_analytics_{period}.png"'
-                }
-            )
-
-        except Exception as err:
-            _LOGGER.error("Error generating solar analytics export: %s", err, exc_info=True)
-            return web.json_response({
-                "success": False,
-                "error": str(err)
-            }, status=500)
-
-
-class ExportBatteryAnalyticsView(HomeAssistantView):
-    """View to export battery analytics as PNG (Matplotlib)."""
-
-    url = "/api/sfml_stats/export_battery_analytics"
-    name = "api:sfml_stats:export_battery_analytics"
-    requires_auth = False
-
-    @local_only
-    async def post(self, request: web.Request) -> web.Response:
-        """Generate and return battery analytics PNG."""
-        try:
-            data = await request.json()
-            period = data.get("period", "week")
-            stats = data.get("stats", {})
-            history = data.get("data", [])
-
-            _LOGGER.info("Generating battery analytics export: period=%s, data_points=%d", period, len(history))
-
-            from ..charts.battery_analytics import BatteryAnalyticsChart
-
-            chart = BatteryAnalyticsChart(
-                period=period,
-                stats=stats,
-                data=history
-            )
-
-            png_bytes = await chart.async_render()
-
-            return web.Response(
-                body=png_bytes,
-                content_type="image/png",
-                headers={
-                    "Content-Disposition": f'attachment; filename="battery_analytics_{period}.png"'
-                }
-            )
-
-        except Exception as err:
-            _LOGGER.error("Error generating battery analytics export: %s", err, exc_info=True)
-            return web.json_response({
-                "success": False,
-                "error": str(err)
-            }, status=500)
-
-
-class ExportHouseAnalyticsView(HomeAssistantView):
-    """View to export house analytics as PNG (Matplotlib)."""
-
-    url = "/api/sfml_stats/export_house_analytics"
-    name = "api:sfml_stats:export_house_analytics"
-    requires_auth = False
-
-    @local_only
-    async def post(self, request: web.Request) -> web.Response:
-        """Generate and return house analytics PNG."""
-        try:
-            data = await request.json()
-            period = data.get("period", "week")
-            stats = data.get("stats", {})
-            history = data.get("data", [])
-
-            _LOGGER.info("Generating house analytics export: period=%s, data_points=%d", period, len(history))
-
-            from ..charts.house_analytics import HouseAnalyticsChart
-
-            chart = HouseAnalyticsChart(
-                period=period,
-                stats=stats,
-                data=history
-            )
-
-            png_bytes = await chart.async_render()
-
-            return web.Response(
-                body=png_bytes,
-                content_type="image/png",
-                headers={
-                    "Content-Disposition": f'attachment; filename="house_analytics_{period}.png"'
-                }
-            )
-
-        except Exception as err:
-            _LOGGER.error("Error generating house analytics export: %s", err, exc_info=True)
-            return web.json_response({
-                "success": False,
-                "error": str(err)
-            }, status=500)
-
-
-class ExportGridAnalyticsView(HomeAssistantView):
-    """View to export grid analytics as PNG (Matplotlib)."""
-
-    url = "/api/sfml_stats/export_grid_analytics"
-    name = "api:sfml_stats:export_grid_analytics"
-    requires_auth = False
-
-    @local_only
-    async def post(self, request: web.Request) -> web.Response:
-        """Generate and return grid analytics PNG."""
-        try:
-            data = await request.json()
-            period = data.get("period", "week")
-            stats = data.get("stats", {})
-            history = data.get("data", [])
-
-            _LOGGER.info("Generating grid analytics export: period=%s, data_points=%d", period, len(history))
-
-            from ..charts.grid_analytics import GridAnalyticsChart
-
-            chart = GridAnalyticsChart(
-                period=period,
-                stats=stats,
-                data=history
-            )
-
-            png_bytes = await chart.async_render()
-
-            return web.Response(
-                body=png_bytes,
-                content_type="image/png",
-                headers={
-                    "Content-Disposition": f'attachment; filename="grid_analytics_{period}.png"'
+                    "Content-Disposition": f'attachment; filename="{self._slug}_analytics_{period}.png"'
                 }
             )
 
         except Exception as err:
-            _LOGGER.error("Error generating grid analytics export: %s", err, exc_info=True)
+            _LOGGER.error("Error generating %s analytics export: %s", self._slug, err, exc_info=True)
             return web.json_response({
                 "success": False,
                 "error": str(err)
@@ -1562,7 +1826,7 @@ class WeatherHistoryView(HomeAssistantView):
             history = await collector.get_history(days=365)
             stats = await collector.get_statistics()
 
-            return web.json_response({
+            return _json_response({
                 "success": True,
                 "data": history,
                 "stats": stats
@@ -1597,7 +1861,7 @@ class WeatherComparisonView(HomeAssistantView):
 
             comparison = await collector.get_comparison_data(days=days)
 
-            return web.json_response(comparison)
+            return _json_response(comparison)
 
         except Exception as err:
             _LOGGER.error("Error fetching weather comparison: %s", err, exc_info=True)
@@ -1607,48 +1871,31 @@ class WeatherComparisonView(HomeAssistantView):
             }, status=500)
 
 
-class ExportWeatherAnalyticsView(HomeAssistantView):
-    """View to export weather analytics as PNG."""
-
-    url = "/api/sfml_stats/export_weather_analytics"
-    name = "api:sfml_stats:export_weather_analytics"
-    requires_auth = False
-
-    @local_only
-    async def post(self, request: web.Request) -> web.Response:
-        """Generate and return weather analytics PNG."""
-        try:
-            data = await request.json()
-            period = data.get("period", "week")
-            stats = data.get("stats", {})
-            history = data.get("data", [])
-
-            _LOGGER.info("Generating weather analytics export: period=%s, data_points=%d", period, len(history))
-
-            from ..charts.weather_analytics import WeatherAnalyticsChart
+def _state_time(state: Any) -> datetime:
+    """Return a recorder state's update time as an aware datetime. @zara"""
+    state_time = state.last_updated if hasattr(state, "last_updated") else state.last_changed
+    if state_time.tzinfo is None:
+        state_time = state_time.replace(tzinfo=timezone.utc)
+    return state_time
 
-            chart = WeatherAnalyticsChart(
-                period=period,
-                stats=stats,
-                data=history
-            )
 
-            png_bytes = await chart.async_render()
+def _state_bucket_value(state: Any) -> float | None:
+    """Return a state's numeric value rounded for the history buckets. @zara"""
+    try:
+        return round(float(state.state), 3)
+    except (ValueError, TypeError):
+        return None
 
-            return web.Response(
-                body=png_bytes,
-                content_type="image/png",
-                headers={
-                    "Content-Disposition": f'attachment; filename="weather_analytics_{period}.png"'
-                }
-            )
 
-        except Exception as err:
-            _LOGGER.error("Error generating weather analytics export: %s", err, exc_info=True)
-            return web.json_response({
-                "success": False,
-                "error": str(err)
-            }, status=500)
+# History bucket fields that count as real power flow data
+_POWER_FLOW_KEYS = (
+    "solar_power",
+    "solar_to_house",
+    "solar_to_battery",
+    "battery_to_house",
+    "grid_to_house",
+    "home_consumption",
+)
 
 
 class PowerSourcesHistoryView(HomeAssistantView):
@@ -1709,10 +1956,14 @@ class PowerSourcesHistoryView(HomeAssistantView):
                 data_source = "recorder"
 
                 # Check if we got any actual data from recorder
-                has_data = any(
-                    any(d.get(k) is not None for k in ['solar_power', 'solar_to_house', 'solar_to_battery', 'battery_to_house', 'grid_to_house', 'home_consumption'])
-                    for d in processed_data
-                )
+                has_data = False
+                for d in processed_data:
+                    for k in _POWER_FLOW_KEYS:
+                        if d.get(k) is not None:
+                            has_data = True
+                            break
+                    if has_data:
+                        break
 
                 if not has_data:
                     # Last resort: try hourly file fallback
@@ -1722,7 +1973,7 @@ class PowerSourcesHistoryView(HomeAssistantView):
                         data_source = "hourly_file"
                         _LOGGER.info("Got %d entries from hourly file", len(file_data))
 
-            return web.json_response({
+            return _json_response({
                 "success": True,
                 "timestamp": datetime.now().isoformat(),
                 "hours": hours,
@@ -1810,16 +2061,10 @@ class PowerSourcesHistoryView(HomeAssistantView):
         try:
             hourly_path = Path(HASS.config.path()) / "sfml_stats" / "data" / "hourly_billing_history.json"
 
-            if not hourly_path.exists():
+            data = await _read_json_file(hourly_path)
+            if not data:
                 return []
 
-            import aiofiles
-            import json
-
-            async with aiofiles.open(hourly_path, 'r') as f:
-                content = await f.read()
-                data = json.loads(content)
-
             hours_data = data.get("hours", {})
             result = []
 
@@ -1843,32 +2088,18 @@ class PowerSourcesHistoryView(HomeAssistantView):
         try:
             collector_path = Path(HASS.config.path()) / "sfml_stats" / "data" / "power_sources_history.json"
 
-            if not collector_path.exists():
+            data, index = await _read_json_file_indexed(collector_path)
+            if not data:
                 _LOGGER.debug("Power sources collector file not found")
                 return []
 
-            import aiofiles
-            import json
-
-            async with aiofiles.open(collector_path, 'r') as f:
-                content = await f.read()
-                data = json.loads(content)
-
             data_points = data.get("data_points", [])
             if not data_points:
                 return []
 
-            # Filter by time
+            # Filter by time on the timestamps parsed when the file was cached
             cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-            filtered = []
-
-            for dp in data_points:
-                try:
-                    ts = datetime.fromisoformat(dp["timestamp"].replace('Z', '+00:00'))
-                    if ts > cutoff:
-                        filtered.append(dp)
-                except (ValueError, KeyError):
-                    continue
+            filtered = index["timestamps"].rows_since(data_points, cutoff)
 
             _LOGGER.debug("Power sources collector: %d points after filtering", len(filtered))
             return sorted(filtered, key=lambda x: x["timestamp"])
@@ -1886,22 +2117,25 @@ class PowerSourcesHistoryView(HomeAssistantView):
     ) -> list[dict]:
         """Process and align history data into time series. @zara"""
         # Create time buckets (5-minute intervals)
-        interval_minutes = 5
-        buckets = []
-        current_time = start_time
-
-        while current_time <= end_time:
-            buckets.append({
-                "timestamp": current_time.isoformat(),
-                "solar_power": None,
-                "solar_to_house": None,
-                "solar_to_battery": None,
-                "battery_to_house": None,
-                "grid_to_house": None,
-                "home_consumption": None,
-                "battery_soc": None,
-            })
-            current_time += timedelta(minutes=interval_minutes)
+        interval = timedelta(minutes=5)
+        bucket_count = (end_time - start_time) // interval + 1 if end_time >= start_time else 0
+        times = [start_time + interval * i for i in range(bucket_count)]
+        # Aware bucket times, parallel to buckets, for the alignment below
+        if start_time.tzinfo is None:
+            bucket_times = [t.replace(tzinfo=timezone.utc) for t in times]
+        else:
+            bucket_times = times
+
+        empty_bucket = dict.fromkeys((
+            "solar_power",
+            "solar_to_house",
+            "solar_to_battery",
+            "battery_to_house",
+            "grid_to_house",
+            "home_consumption",
+            "battery_soc",
+        ))
+        buckets = [{"timestamp": t.isoformat(), **empty_bucket} for t in times]
 
         # Fill buckets with sensor data
         for sensor_key, entity_id in sensors.items():
@@ -1912,77 +2146,208 @@ class PowerSourcesHistoryView(HomeAssistantView):
             if not states:
                 continue
 
-            # Sort states by time
-            sorted_states = sorted(states, key=lambda s: s.last_updated if hasattr(s, 'last_updated') else s.last_changed)
+            # Sort states by time, normalizing each timestamp once
+            timed_states = sorted(
+                ((_state_time(state), state) for state in states), key=lambda item: item[0]
+            )
+            state_times = [state_time for state_time, _ in timed_states]
+            state_values = [_state_bucket_value(state) for _, state in timed_states]
 
+            # Buckets and states are both sorted by time, so each search can
+            # start at the previous match
             state_idx = 0
-            for bucket in buckets:
-                bucket_time = datetime.fromisoformat(bucket["timestamp"])
-                if bucket_time.tzinfo is None:
-                    bucket_time = bucket_time.replace(tzinfo=timezone.utc)
-
-                # Find the most recent state before bucket time
-                while (state_idx < len(sorted_states) - 1):
-                    next_state = sorted_states[state_idx + 1]
-                    next_time = next_state.last_updated if hasattr(next_state, 'last_updated') else next_state.last_changed
-                    if next_time.tzinfo is None:
-                        next_time = next_time.replace(tzinfo=timezone.utc)
-                    if next_time <= bucket_time:
-                        state_idx += 1
-                    else:
-                        break
+            for bucket, bucket_time in zip(buckets, bucket_times):
+                # Find the most recent state before bucket time (or the first state)
+                state_idx = max(
+                    bisect.bisect_right(state_times, bucket_time, state_idx) - 1, state_idx
+                )
 
-                if state_idx < len(sorted_states):
-                    state = sorted_states[state_idx]
-                    try:
-                        value = float(state.state)
-                        bucket[sensor_key] = round(value, 3)
-                    except (ValueError, TypeError):
-                        pass
+                value = state_values[state_idx]
+                if value is not None:
+                    bucket[sensor_key] = value
 
         return buckets
 
 
+class _ImageCache:
+    """Small LRU of rendered chart images bounded by entry count and total size. @zara
+
+    Keys are BLAKE2b digests of the canonical export payload, so re-opening
+    the dashboard or a second tab asking for the same chart skips Matplotlib.
+    """
+
+    __slots__ = ("_entries", "_max_entries", "_max_bytes", "_size")
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        """Initialize the cache. @zara"""
+        self._entries: OrderedDict[bytes, bytes] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._size = 0
+
+    @staticmethod
+    def key(*parts: Any) -> bytes:
+        """Digest the payload parts independent of dict key order. @zara"""
+        return hashlib.blake2b(
+            orjson.dumps(parts, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> bytes | None:
+        """Return a cached image and mark it as recently used. @zara"""
+        image = self._entries.get(key)
+        if image is not None:
+            self._entries.move_to_end(key)
+        return image
+
+    def put(self, key: bytes, image: bytes) -> None:
+        """Store an image, evicting least recently used entries over budget. @zara"""
+        if len(image) > self._max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+        self._entries[key] = image
+        self._size += len(image)
+        while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+_EXPORT_IMAGE_CACHE = _ImageCache(max_entries=32, max_bytes=64 * 1024 * 1024)
+
+# Renders in progress by cache key, so concurrent identical exports render once
+_EXPORT_INFLIGHT: dict[bytes, asyncio.Task[bytes]] = {}
+
+# Rendered exports are also written below <config>/sfml_stats/.cache/exports
+# so they survive Home Assistant restarts; only the newest files are kept.
+_EXPORT_DISK_CACHE_MAX_FILES = 64
+
+
+def _export_cache_file(key: bytes, image_format: str) -> Path | None:
+    """Return the on-disk location for a cached export. @zara"""
+    if HASS is None:
+        return None
+    return Path(HASS.config.path()) / SFML_STATS_CACHE / "exports" / f"{key.hex()}.{image_format}"
+
+
+def _write_cached_image(path: Path, image: bytes) -> None:
+    """Write a cached export and prune the oldest files. @zara"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(image)
+        tmp_path.replace(path)
+
+        cached = sorted(
+            (p for p in path.parent.iterdir() if p.suffix in _EXPORT_CONTENT_TYPES),
+            key=lambda p: p.stat().st_mtime,
+        )
+        for old_path in cached[:-_EXPORT_DISK_CACHE_MAX_FILES]:
+            old_path.unlink(missing_ok=True)
+    except OSError as err:
+        _LOGGER.debug("Could not write export cache %s: %s", path, err)
+
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Export image formats by file suffix; WebP is only sent to clients that
+# list image/webp in their Accept header
+_EXPORT_CONTENT_TYPES = {".png": "image/png", ".webp": "image/webp"}
+
+# Upper bounds for export requests; the view is reachable without auth on
+# the local network, so oversized payloads are rejected before rendering.
+_EXPORT_MAX_BODY = 8 * 1024 * 1024
+_EXPORT_MAX_POINTS = 50_000
+
+
+def _export_headers(filename: str) -> dict[str, str]:
+    """Response headers for an exported chart image download. @zara"""
+    return {
+        "Content-Type": _EXPORT_CONTENT_TYPES[Path(filename).suffix],
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Vary": "Accept",
+    }
+
+
+async def _stream_image(request: web.Request, image: bytes, filename: str) -> web.StreamResponse:
+    """Send a rendered chart image as a download in 64 KiB chunks. @zara
+
+    Used for renders held in memory; the body is sliced through a memoryview
+    so no chunk is copied, and each write waits for the transport to drain
+    before the next one is queued. Disk cache hits go through FileResponse.
+    """
+    response = web.StreamResponse(headers=_export_headers(filename))
+    response.content_length = len(image)
+    await response.prepare(request)
+    view = memoryview(image)
+    for offset in range(0, len(view), _STREAM_CHUNK_SIZE):
+        await response.write(view[offset:offset + _STREAM_CHUNK_SIZE])
+    await response.write_eof()
+    return response
+
+
 class ExportPowerSourcesView(HomeAssistantView):
-    """View to export power sources chart as PNG. @zara"""
+    """View to export power sources chart as PNG (or WebP if accepted). @zara"""
 
     url = "/api/sfml_stats/export_power_sources"
     name = "api:sfml_stats:export_power_sources"
     requires_auth = False
 
+    def __init__(self) -> None:
+        """Initialize the view; the chart class is imported on first use. @zara"""
+        self._chart_cls: type | None = None
+
     @local_only
     async def post(self, request: web.Request) -> web.Response:
         """Generate and return power sources PNG. @zara"""
+        if (request.content_length or 0) > _EXPORT_MAX_BODY:
+            return _json_response({
+                "success": False,
+                "error": "Request body too large"
+            }, status=413)
+
         try:
-            data = await request.json()
+            data = orjson.loads(await request.read())
             period = data.get("period", "today")
             stats = data.get("stats", {})
             history = data.get("data", [])
 
+            if len(history) > _EXPORT_MAX_POINTS:
+                return _json_response({
+                    "success": False,
+                    "error": f"Too many data points (max {_EXPORT_MAX_POINTS})"
+                }, status=413)
+
             # Convert reactive proxy to plain dict if needed
             if hasattr(stats, '__dict__'):
                 stats = dict(stats)
 
-            _LOGGER.info("Generating power sources export: period=%s, data_points=%d, stats_keys=%s",
-                         period, len(history), list(stats.keys()) if stats else [])
+            image_format = "webp" if "image/webp" in request.headers.get("Accept", "") else "png"
 
-            from ..charts.power_sources import PowerSourcesChart
+            # VERSION is part of the key so an update never serves old renders
+            cache_key = _ImageCache.key(VERSION, image_format, period, stats, history)
+            image_bytes = _EXPORT_IMAGE_CACHE.get(cache_key)
 
-            chart = PowerSourcesChart(
-                period=period,
-                stats=stats,
-                data=history
-            )
+            filename = f"power_sources_{period}.{image_format}"
 
-            png_bytes = await chart.async_render()
+            if image_bytes is None:
+                # Rendered before (possibly before a restart): let aiohttp
+                # sendfile() it straight from disk
+                cache_file = _export_cache_file(cache_key, image_format)
+                if cache_file is not None and await asyncio.to_thread(cache_file.is_file):
+                    _LOGGER.debug("Serving disk-cached power sources export: period=%s", period)
+                    return web.FileResponse(cache_file, headers=_export_headers(filename))
 
-            return web.Response(
-                body=png_bytes,
-                content_type="image/png",
-                headers={
-                    "Content-Disposition": f'attachment; filename="power_sources_{period}.png"'
-                }
-            )
+                # Identical requests arriving during a render share its result
+                task = _EXPORT_INFLIGHT.get(cache_key)
+                if task is None:
+                    task = _EXPORT_INFLIGHT[cache_key] = asyncio.create_task(
+                        self._render(cache_key, cache_file, image_format, period, stats, history)
+                    )
+                    task.add_done_callback(lambda _: _EXPORT_INFLIGHT.pop(cache_key, None))
+                image_bytes = await asyncio.shield(task)
+            else:
+                _LOGGER.debug("Serving cached power sources export: period=%s", period)
 
         except Exception as err:
             import traceback
@@ -1992,6 +2357,43 @@ class ExportPowerSourcesView(HomeAssistantView):
                 "error": str(err)
             }, status=500)
 
+        return await _stream_image(request, image_bytes, filename)
+
+    async def _render(
+        self,
+        cache_key: bytes,
+        cache_file: Path | None,
+        image_format: str,
+        period: str,
+        stats: dict,
+        history: list,
+    ) -> bytes:
+        """Render an export and store it in both caches. @zara"""
+        _LOGGER.info("Generating power sources export: period=%s, data_points=%d, stats_keys=%s",
+                     period, len(history), list(stats.keys()) if stats else [])
+
+        chart_cls = self._chart_cls
+        if chart_cls is None:
+            from ..charts.power_sources import PowerSourcesChart
+            chart_cls = self._chart_cls = PowerSourcesChart
+
+        chart = chart_cls(
+            period=period,
+            stats=stats,
+            data=history
+        )
+
+        image_bytes = await chart.async_render(image_format)
+        if cache_file is not None:
+            # Persist off the response path; the client gets the image now
+            HASS.async_create_background_task(
+                asyncio.to_thread(_write_cached_image, cache_file, image_bytes),
+                f"{DOMAIN}_export_cache_write",
+            )
+
+        _EXPORT_IMAGE_CACHE.put(cache_key, image_bytes)
+        return image_bytes
+
 
 class EnergySourcesDailyStatsView(HomeAssistantView):
     """API for daily energy sources statistics. @zara"""
@@ -2025,62 +2427,58 @@ class EnergySourcesDailyStatsView(HomeAssistantView):
             if collector is None:
                 # Fallback: read directly from file
                 data_path = Path(HASS.config.path()) / "sfml_stats" / "data" / "energy_sources_daily_stats.json"
-                if data_path.exists():
-                    import aiofiles
-                    async with aiofiles.open(data_path, 'r') as f:
-                        content = await f.read()
-                        daily_stats = json.loads(content)
-                else:
+                try:
+                    # Parsed fresh (not via the JSON cache): merged into below
+                    daily_stats = orjson.loads(await asyncio.to_thread(data_path.read_bytes))
+                except FileNotFoundError:
                     daily_stats = {"days": {}}
             else:
                 daily_stats = await collector.get_daily_stats(days)
 
             # Merge with daily_energy_history.json for more complete data
             history_path = Path(HASS.config.path()) / "sfml_stats" / "data" / "daily_energy_history.json"
-            if history_path.exists():
-                import aiofiles
-                async with aiofiles.open(history_path, 'r') as f:
-                    content = await f.read()
-                    history_data = json.loads(content)
-                    history_days = history_data.get("days", {})
-
-                    # Merge history data into daily_stats (add missing days)
-                    for date_str, day_data in history_days.items():
-                        if date_str not in daily_stats.get("days", {}):
-                            # Convert history format to daily_stats format
-                            daily_stats.setdefault("days", {})[date_str] = {
-                                "date": date_str,
-                                "solar_to_house_kwh": day_data.get("solar_to_house_kwh", 0),
-                                "solar_to_battery_kwh": day_data.get("battery_charge_solar_kwh", 0),
-                                "battery_to_house_kwh": day_data.get("battery_to_house_kwh", 0),
-                                "battery_charge_grid_kwh": day_data.get("battery_charge_grid_kwh", 0),
-                                "grid_to_house_kwh": day_data.get("grid_import_kwh", 0),
-                                "grid_export_kwh": day_data.get("grid_export_kwh", 0),
-                                "home_consumption_kwh": day_data.get("home_consumption_kwh", 0),
-                                "solar_yield_kwh": day_data.get("solar_yield_kwh", 0),
-                                "price_ct_kwh": day_data.get("price_ct_kwh", 0),
-                                "autarky_percent": day_data.get("autarky_percent", 0),
-                                "self_consumption_percent": day_data.get("self_consumption_percent", 0),
-                                "avg_soc": day_data.get("avg_soc", 0),
-                                "min_soc": day_data.get("min_soc", 0),
-                                "max_soc": day_data.get("max_soc", 0),
-                                "peak_battery_power_w": day_data.get("peak_battery_power_w", 0),
-                                "peak_consumption_w": day_data.get("peak_battery_power_w", 0),  # Use battery peak as proxy
-                            }
-                        else:
-                            # Merge additional fields from history into existing day data
-                            existing = daily_stats["days"][date_str]
-                            if existing.get("peak_battery_power_w") is None or existing.get("peak_battery_power_w") == 0:
-                                existing["peak_battery_power_w"] = day_data.get("peak_battery_power_w", 0)
-                            # Also merge home_consumption, autarky, etc. if missing
-                            if existing.get("home_consumption_kwh") is None or existing.get("home_consumption_kwh") == 0:
-                                existing["home_consumption_kwh"] = day_data.get("home_consumption_kwh", 0)
-                            if existing.get("autarky_percent") is None or existing.get("autarky_percent") == 0:
-                                existing["autarky_percent"] = day_data.get("autarky_percent", 0)
-                            if existing.get("self_consumption_percent") is None or existing.get("self_consumption_percent") == 0:
-                                existing["self_consumption_percent"] = day_data.get("self_consumption_percent", 0)
-                            if existing.get("peak_consumption_w") is None or existing.get("peak_consumption_w") == 0:
-                                existing["peak_consumption_w"] = day_data.get("peak_battery_power_w", 0)
+            # Read-only here, so the shared cached copy can be used
+            history_data = await _read_json_file(history_path)
+            if history_data:
+                history_days = history_data.get("days", {})
+
+                # Merge history data into daily_stats (add missing days)
+                for date_str, day_data in history_days.items():
+                    if date_str not in daily_stats.get("days", {}):
+                        # Convert history format to daily_stats format
+                        daily_stats.setdefault("days", {})[date_str] = {
+                            "date": date_str,
+                            "solar_to_house_kwh": day_data.get("solar_to_house_kwh", 0),
+                            "solar_to_battery_kwh": day_data.get("battery_charge_solar_kwh", 0),
+                            "battery_to_house_kwh": day_data.get("battery_to_house_kwh", 0),
+                            "battery_charge_grid_kwh": day_data.get("battery_charge_grid_kwh", 0),
+                            "grid_to_house_kwh": day_data.get("grid_import_kwh", 0),
+                            "grid_export_kwh": day_data.get("grid_export_kwh", 0),
+                            "home_consumption_kwh": day_data.get("home_consumption_kwh", 0),
+                            "solar_yield_kwh": day_data.get("solar_yield_kwh", 0),
+                            "price_ct_kwh": day_data.get("price_ct_kwh", 0),
+                            "autarky_percent": day_data.get("autarky_percent", 0),
+                            "self_consumption_percent": day_data.get("self_consumption_percent", 0),
+                            "avg_soc": day_data.get("avg_soc", 0),
+                            "min_soc": day_data.get("min_soc", 0),
+                            "max_soc": day_data.get("max_soc", 0),
+                            "peak_battery_power_w": day_data.get("peak_battery_power_w", 0),
+                            "peak_consumption_w": day_data.get("peak_battery_power_w", 0),  # Use battery peak as proxy
+                        }
+                    else:
+                        # Merge additional fields from history into existing day data
+                        existing = daily_stats["days"][date_str]
+                        if existing.get("peak_battery_power_w") is None or existing.get("peak_battery_power_w") == 0:
+                            existing["peak_battery_power_w"] = day_data.get("peak_battery_power_w", 0)
+                        # Also merge home_consumption, autarky, etc. if missing
+                        if existing.get("home_consumption_kwh") is None or existing.get("home_consumption_kwh") == 0:
+                            existing["home_consumption_kwh"] = day_data.get("home_consumption_kwh", 0)
+                        if existing.get("autarky_percent") is None or existing.get("autarky_percent") == 0:
+                            existing["autarky_percent"] = day_data.get("autarky_percent", 0)
+                        if existing.get("self_consumption_percent") is None or existing.get("self_consumption_percent") == 0:
+                            existing["self_consumption_percent"] = day_data.get("self_consumption_percent", 0)
+                        if existing.get("peak_consumption_w") is None or existing.get("peak_consumption_w") == 0:
+                            existing["peak_consumption_w"] = day_data.get("peak_battery_power_w", 0)
 
             # Also get current sensor values for real-time display
             config = _get_config()
@@ -2112,7 +2510,7 @@ class EnergySourcesDailyStatsView(HomeAssistantView):
                 "home_consumption": _get_sensor_value(config.get(CONF_SENSOR_HOME_CONSUMPTION)),
             }
 
-            return web.json_response({
+            return _json_response({
                 "success": True,
                 "timestamp": datetime.now().isoformat(),
                 "days_requested": days,
@@ -2315,7 +2713,7 @@ class MonthlyTariffsView(HomeAssistantView):
 
             summary = await tariff_manager.get_year_summary(year)
 
-            return web.json_response({
+            return _json_response({
                 "success": True,
                 "timestamp": datetime.now().isoformat(),
                 **summary,
@@ -2569,7 +2967,7 @@ class MonthlyTariffsExportView(HomeAssistantView):
 
             filename = f"monthly_tariffs_{start}_{end}.csv"
 
-            return web.Response(
+            response = web.Response(
                 text=csv_content,
                 content_type="text/csv",
                 charset="utf-8",
@@ -2577,6 +2975,10 @@ class MonthlyTariffsExportView(HomeAssistantView):
                     "Content-Disposition": f'attachment; filename="{filename}"'
                 }
             )
+            # Multi-month CSV is plain text and compresses well
+            if len(csv_content) >= _COMPRESS_MIN_SIZE:
+                response.enable_compression()
+            return response
 
         except Exception as err:
             _LOGGER.error("Error exporting monthly tariffs: %s", err, exc_info=True)
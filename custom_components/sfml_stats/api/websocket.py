@@ -17,6 +17,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import aiofiles
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
 
@@ -117,8 +118,6 @@ async def websocket_get_dashboard_data(
     }
 
     try:
-        import aiofiles
-
         summaries_path = solar_path / "stats" / "daily_summaries.json"
         if summaries_path.exists():
             async with aiofiles.open(summaries_path, "r") as f:
@@ -169,8 +168,6 @@ async def _get_realtime_data(hass: HomeAssistant) -> dict:
     }
 
     try:
-        import aiofiles
-
         predictions_path = solar_path / "stats" / "hourly_predictions.json"
         if predictions_path.exists():
             async with aiofiles.open(predictions_path, "r") as f:
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import asyncio
 import io
+import itertools
 import logging
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
@@ -28,10 +29,64 @@ _LOGGER = logging.getLogger(__name__)
 # Shared executor for matplotlib operations
 _MATPLOTLIB_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="matplotlib")
 
+# Power flow keys of a data point, in the row order used by _parse_series
+_FLOW_KEYS = (
+    'solar_to_house',
+    'solar_to_battery',
+    'battery_to_house',
+    'grid_to_house',
+    'home_consumption',
+)
+
+# Pillow encoder options per output format; zlib level 3 is much faster than
+# the default for PNG, as the chart is mostly flat colour areas
+_SAVE_OPTIONS = {
+    'png': {'compress_level': 3},
+    'webp': {'quality': 85, 'method': 4},
+}
+
+# Two points per pixel column of the 16 inch wide figure
+_MAX_PLOT_POINTS = 2 * 16 * CHART_DPI
+
+
+def _lttb_indices(x: Any, y: Any, n_out: int) -> Any:
+    """Pick n_out indices with Largest-Triangle-Three-Buckets. @zara
+
+    The first and last point are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the average of the next bucket.
+    """
+    import numpy as np
+
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets over the inner points, plus the last point as the
+    # "next bucket" of the final one
+    edges = np.append(np.linspace(1, n - 1, n_out - 1).astype(np.intp), n)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, end, next_end = edges[i], edges[i + 1], edges[i + 2]
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        px, py = x[prev], y[prev]
+        area = np.abs((px - avg_x) * (y[start:end] - py) - (px - x[start:end]) * (avg_y - py))
+        prev = start + int(area.argmax())
+        keep[i + 1] = prev
+
+    return keep
+
 
 class PowerSourcesChart:
     """Chart für Power Sources PNG-Export - Stacked Area Chart. @zara"""
 
+    __slots__ = ("period", "stats", "data", "_styles", "_series")
+
     def __init__(
         self,
         period: str,
@@ -49,26 +104,31 @@ class PowerSourcesChart:
         self.stats = stats
         self.data = data
         self._styles = ChartStyles()
+        self._series: tuple[list[datetime], Any, Any] | None = None
 
-    async def async_render(self) -> bytes:
-        """Render chart to PNG bytes. @zara
+    async def async_render(self, image_format: str = "png") -> bytes:
+        """Render chart to image bytes. @zara
 
         Runs all matplotlib operations in a thread executor to avoid
         blocking the event loop.
 
+        Args:
+            image_format: 'png' or 'webp'
+
         Returns:
-            PNG image as bytes
+            Encoded image as bytes
         """
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
             _MATPLOTLIB_EXECUTOR,
-            self._render_sync
+            self._render_sync,
+            image_format,
         )
 
-    def _render_sync(self) -> bytes:
+    def _render_sync(self, image_format: str = "png") -> bytes:
         """Synchronous render - runs in executor thread. @zara"""
-        import matplotlib.pyplot as plt
-        import numpy as np
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
         from .styles import apply_dark_theme
 
         try:
@@ -79,8 +139,10 @@ class PowerSourcesChart:
 
         apply_dark_theme()
 
-        # Create figure with 2 rows
-        fig = plt.figure(figsize=(16, 10), facecolor=self._styles.background)
+        # Create figure with 2 rows; a bare Agg canvas bypasses pyplot's
+        # global figure manager, so nothing has to be closed afterwards
+        fig = Figure(figsize=(16, 10), facecolor=self._styles.background)
+        FigureCanvasAgg(fig)
         gs = fig.add_gridspec(2, 1, height_ratios=[3, 1], hspace=0.15, top=0.92, bottom=0.08)
 
         # Title
@@ -107,17 +169,68 @@ class PowerSourcesChart:
         buf = io.BytesIO()
         fig.savefig(
             buf,
-            format='png',
+            format=image_format,
             dpi=CHART_DPI,
             bbox_inches='tight',
             facecolor=self._styles.background,
             edgecolor='none',
+            pil_kwargs=_SAVE_OPTIONS[image_format],
         )
-        plt.close(fig)
 
         buf.seek(0)
         return buf.read()
 
+    def _parse_series(self) -> tuple[list[datetime], Any, Any]:
+        """Parse the data points once for both subplots. @zara
+
+        Timestamps are parsed per point (invalid ones are skipped); the power
+        values are converted to kW and clipped at zero as one NumPy array.
+
+        Returns:
+            (timestamps, flows, soc): flows has one row per _FLOW_KEYS entry,
+            soc holds NaN where a point carries no battery_soc.
+        """
+        if self._series is not None:
+            return self._series
+
+        import numpy as np
+
+        timestamps = []
+        rows = []
+        soc = []
+        for point in self.data:
+            ts = point.get('timestamp')
+            # Cheap shape check first, so noisy input is skipped without
+            # raising; fromisoformat accepts the 'Z' suffix since Python 3.11
+            if not isinstance(ts, str) or not ts[:4].isdigit():
+                continue
+            try:
+                dt = datetime.fromisoformat(ts)
+            except ValueError:
+                continue
+            timestamps.append(dt)
+            # Missing values count as 0 W
+            rows.append([point.get(key) or 0 for key in _FLOW_KEYS])
+            soc_val = point.get('battery_soc')
+            soc.append(np.nan if soc_val is None else soc_val)
+
+        # Values are in W, convert to kW for display and ensure non-negative
+        flows = np.array(rows, dtype=float).reshape(-1, len(_FLOW_KEYS)).T
+        flows = np.maximum(flows / 1000, 0)
+        soc = np.array(soc, dtype=float)
+
+        # More points than the PNG has pixel columns only overdraw; keep the
+        # visually significant ones (chosen on consumption, the top envelope)
+        if len(timestamps) > _MAX_PLOT_POINTS:
+            seconds = np.array([dt.timestamp() for dt in timestamps])
+            keep = _lttb_indices(seconds, flows[_FLOW_KEYS.index('home_consumption')], _MAX_PLOT_POINTS)
+            timestamps = [timestamps[i] for i in keep]
+            flows = flows[:, keep]
+            soc = soc[keep]
+
+        self._series = (timestamps, flows, soc)
+        return self._series
+
     def _render_stacked_area(self, ax: Any) -> None:
         """Render the main stacked area chart. @zara"""
         import matplotlib.pyplot as plt
@@ -129,37 +242,7 @@ class PowerSourcesChart:
             ax.axis('off')
             return
 
-        # Extract data
-        timestamps = []
-        solar_to_house = []
-        solar_to_battery = []
-        battery = []
-        grid = []
-        consumption = []
-
-        for point in self.data:
-            ts = point.get('timestamp', '')
-            if ts:
-                try:
-                    dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                    timestamps.append(dt)
-                except (ValueError, TypeError):
-                    continue
-
-                # Get values, default to 0 if None
-                # Values are in W, convert to kW for display
-                solar_to_house_val = (point.get('solar_to_house') or 0) / 1000
-                solar_to_battery_val = (point.get('solar_to_battery') or 0) / 1000
-                battery_val = (point.get('battery_to_house') or 0) / 1000
-                grid_val = (point.get('grid_to_house') or 0) / 1000
-                consumption_val = (point.get('home_consumption') or 0) / 1000
-
-                # Ensure non-negative
-                solar_to_house.append(max(0, solar_to_house_val))
-                solar_to_battery.append(max(0, solar_to_battery_val))
-                battery.append(max(0, battery_val))
-                grid.append(max(0, grid_val))
-                consumption.append(max(0, consumption_val))
+        timestamps, flows, _ = self._parse_series()
 
         if not timestamps:
             ax.text(0.5, 0.5, 'Keine gültigen Zeitstempel', ha='center', va='center',
@@ -167,12 +250,7 @@ class PowerSourcesChart:
             ax.axis('off')
             return
 
-        # Convert to numpy arrays
-        solar_to_house = np.array(solar_to_house)
-        solar_to_battery = np.array(solar_to_battery)
-        battery = np.array(battery)
-        grid = np.array(grid)
-        consumption = np.array(consumption)
+        solar_to_house, solar_to_battery, battery, grid, consumption = flows
 
         # Colors matching the frontend
         solar_to_house_color = '#FFB74D'  # Orange for Solar → Haus
@@ -231,25 +309,16 @@ class PowerSourcesChart:
     def _render_battery_soc(self, ax: Any) -> None:
         """Render battery SOC timeline. @zara"""
         import matplotlib.pyplot as plt
+        import numpy as np
 
         if not self.data:
             ax.axis('off')
             return
 
-        timestamps = []
-        soc_values = []
-
-        for point in self.data:
-            ts = point.get('timestamp', '')
-            soc = point.get('battery_soc')
-
-            if ts and soc is not None:
-                try:
-                    dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                    timestamps.append(dt)
-                    soc_values.append(soc)
-                except (ValueError, TypeError):
-                    continue
+        all_timestamps, _, soc = self._parse_series()
+        has_soc = ~np.isnan(soc)
+        timestamps = list(itertools.compress(all_timestamps, has_soc))
+        soc_values = soc[has_soc]
 
         if not timestamps:
             ax.text(0.5, 0.5, 'Keine SOC-Daten', ha='center', va='center',
@@ -275,6 +275,9 @@ DAILY_AGGREGATION_HOUR: Final = 23
 DAILY_AGGREGATION_MINUTE: Final = 55
 DAILY_AGGREGATION_SECOND: Final = 0
 
+# Config Updates
+CONFIG_UPDATE_DEBOUNCE_SECONDS: Final = 0.15  # Coalesce rapid option edits
+
 # =============================================================================
 # Monthly Tariff Feature Constants
 # =============================================================================
@@ -16,6 +16,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -48,7 +49,7 @@ MAX_DATA_AGE_DAYS = 7
 class PowerSourcesCollector:
     """Collects power sources data periodically. @zara"""
 
-    def __init__(self, hass: HomeAssistant, config: dict[str, Any], data_path: Path) -> None:
+    def __init__(self, hass: HomeAssistant, config: Mapping[str, Any], data_path: Path) -> None:
         """Initialize the collector. @zara"""
         self.hass = hass
         self.config = config
@@ -72,10 +73,17 @@ class PowerSourcesCollector:
 
     async def _ensure_data_files(self) -> None:
         """Ensure data directory and files exist on first installation. @zara"""
-        self.data_path.mkdir(parents=True, exist_ok=True)
+        def _prepare_data_path() -> tuple[bool, bool]:
+            """Create the data directory and check files (blocking). @zara"""
+            self.data_path.mkdir(parents=True, exist_ok=True)
+            return self.data_file.exists(), self.daily_stats_file.exists()
+
+        data_file_exists, daily_stats_exists = await self.hass.async_add_executor_job(
+            _prepare_data_path
+        )
 
         # Initialize power_sources_history.json if not exists
-        if not self.data_file.exists():
+        if not data_file_exists:
             initial_data = {
                 "version": 2,
                 "created": datetime.now(timezone.utc).isoformat(),
@@ -87,7 +95,7 @@ class PowerSourcesCollector:
             _LOGGER.info("Created power_sources_history.json")
 
         # Initialize energy_sources_daily_stats.json if not exists
-        if not self.daily_stats_file.exists():
+        if not daily_stats_exists:
             initial_stats = {
                 "version": 1,
                 "created": datetime.now(timezone.utc).isoformat(),
@@ -376,7 +384,7 @@ class PowerSourcesCollector:
 
     async def _load_daily_stats(self) -> dict[str, Any]:
         """Load daily statistics from file. @zara"""
-        if not self.daily_stats_file.exists():
+        if not await self.hass.async_add_executor_job(self.daily_stats_file.exists):
             return {
                 "version": 1,
                 "created": datetime.now(timezone.utc).isoformat(),
@@ -14,6 +14,7 @@ import calendar
 import logging
 import threading
 from collections import deque
+from collections.abc import Mapping
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -97,7 +98,7 @@ class BillingCalculator:
         self,
         hass: HomeAssistant,
         config_path: Path,
-        entry_data: dict[str, Any] | None = None,
+        entry_data: Mapping[str, Any] | None = None,
     ) -> None:
         """Initialize the calculator. @zara"""
         self._hass = hass
@@ -108,14 +109,14 @@ class BillingCalculator:
         self._cache_timestamp: datetime | None = None
         self._cache_ttl_seconds = BILLING_CACHE_TTL_SECONDS
 
-    def update_config(self, new_config: dict[str, Any]) -> None:
+    def update_config(self, new_config: Mapping[str, Any]) -> None:
         """Update cached configuration and invalidate billing cache. @zara"""
         self._entry_data = new_config
         self._billing_cache = None
         self._cache_timestamp = None
         _log("BillingCalculator config updated, cache invalidated")
 
-    def _get_config(self) -> dict[str, Any]:
+    def _get_config(self) -> Mapping[str, Any]:
         """Get current configuration. @zara"""
         if self._entry_data:
             return self._entry_data
@@ -53,6 +53,7 @@ class DailyEnergyAggregator:
         self._config_path = config_path
         self._data_path = config_path / SFML_STATS_DATA
         self._history_file = self._data_path / DAILY_ENERGY_HISTORY
+        self._last_run_date: date | None = None
 
     def _get_config(self) -> dict[str, Any]:
         """Get current configuration. @zara"""
@@ -82,7 +83,7 @@ class DailyEnergyAggregator:
 
     async def _load_history(self) -> dict[str, Any]:
         """Load existing history file. @zara"""
-        if not self._history_file.exists():
+        if not await self._hass.async_add_executor_job(self._history_file.exists):
             return {"days": {}, "last_updated": None}
 
         try:
@@ -95,7 +96,9 @@ class DailyEnergyAggregator:
 
     async def _save_history(self, history: dict[str, Any]) -> bool:
         """Save history file. @zara"""
-        self._data_path.mkdir(parents=True, exist_ok=True)
+        await self._hass.async_add_executor_job(
+            lambda: self._data_path.mkdir(parents=True, exist_ok=True)
+        )
 
         try:
             async with aiofiles.open(self._history_file, "w", encoding="utf-8") as f:
@@ -105,10 +108,23 @@ class DailyEnergyAggregator:
             _LOGGER.error("Error saving history: %s", err)
             return False
 
+    async def async_already_ran_today(self) -> bool:
+        """Check whether today's values have already been aggregated. @zara"""
+        today = date.today()
+        if self._last_run_date == today:
+            return True
+
+        history = await self._load_history()
+        if today.isoformat() in history.get("days", {}):
+            self._last_run_date = today
+            return True
+        return False
+
     async def async_aggregate_daily(self) -> bool:
         """Aggregate daily values and save them. @zara"""
         config = self._get_config()
-        today_str = date.today().isoformat()
+        today = date.today()
+        today_str = today.isoformat()
 
         _LOGGER.info("Starting daily energy aggregation for %s", today_str)
 
@@ -162,6 +178,7 @@ class DailyEnergyAggregator:
         success = await self._save_history(history)
 
         if success:
+            self._last_run_date = today
             _LOGGER.info(
                 "Daily aggregation saved: Solar=%.2f kWh, Grid import=%.2f kWh, Battery discharged=%.2f kWh",
                 solar_yield,
@@ -175,7 +192,7 @@ class DailyEnergyAggregator:
         """Merge data from energy_sources_daily_stats.json. @zara"""
         daily_stats_file = self._data_path / "energy_sources_daily_stats.json"
 
-        if not daily_stats_file.exists():
+        if not await self._hass.async_add_executor_job(daily_stats_file.exists):
             return
 
         try:
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Mapping
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -66,7 +67,7 @@ class MonthlyTariffManager:
         self,
         hass: HomeAssistant,
         config_path: Path,
-        entry_data: dict[str, Any] | None = None,
+        entry_data: Mapping[str, Any] | None = None,
     ) -> None:
         """Initialize the tariff manager. @zara"""
         self._hass = hass
@@ -77,12 +78,12 @@ class MonthlyTariffManager:
         self._hourly_file = self._data_path / HOURLY_BILLING_HISTORY
         self._cache: dict[str, Any] | None = None
 
-    def update_config(self, new_config: dict[str, Any]) -> None:
+    def update_config(self, new_config: Mapping[str, Any]) -> None:
         """Update cached configuration. @zara"""
         self._entry_data = new_config
         _LOGGER.debug("MonthlyTariffManager config updated")
 
-    def _get_config(self) -> dict[str, Any]:
+    def _get_config(self) -> Mapping[str, Any]:
         """Get current configuration. @zara"""
         if self._entry_data:
             return self._entry_data
@@ -0,0 +1,58 @@
+"""Tests for the SFML Stats daily aggregation schedule. @zara"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.sfml_stats import _next_local_occurrence
+from custom_components.sfml_stats import dt_util
+
+BERLIN = ZoneInfo("Europe/Berlin")
+
+
+def _freeze(monkeypatch: pytest.MonkeyPatch, local_now: datetime) -> None:
+    """Pin dt_util.now()/utcnow() to the given local instant. @zara"""
+    monkeypatch.setattr(dt_util, "now", lambda time_zone=None: local_now)
+    monkeypatch.setattr(
+        dt_util, "utcnow", lambda: local_now.astimezone(timezone.utc)
+    )
+
+
+@pytest.mark.parametrize(
+    ("local_now", "expected_utc", "expected_delay"),
+    [
+        # Spring forward: 2025-03-30 has 23 hours, 23:55 CEST is 21:55 UTC
+        (
+            datetime(2025, 3, 30, 0, 30, tzinfo=BERLIN),
+            datetime(2025, 3, 30, 21, 55, tzinfo=timezone.utc),
+            timedelta(hours=22, minutes=25),
+        ),
+        # Fall back: 2025-10-26 has 25 hours, 23:55 CET is 22:55 UTC
+        (
+            datetime(2025, 10, 26, 0, 30, tzinfo=BERLIN),
+            datetime(2025, 10, 26, 22, 55, tzinfo=timezone.utc),
+            timedelta(hours=24, minutes=25),
+        ),
+        # Already past today's run - roll over into the transition day
+        (
+            datetime(2025, 3, 29, 23, 58, tzinfo=BERLIN),
+            datetime(2025, 3, 30, 21, 55, tzinfo=timezone.utc),
+            timedelta(hours=22, minutes=57),
+        ),
+    ],
+)
+def test_next_daily_run_across_dst(
+    monkeypatch: pytest.MonkeyPatch,
+    local_now: datetime,
+    expected_utc: datetime,
+    expected_delay: timedelta,
+) -> None:
+    """The 23:55 run lands on local 23:55 on DST transition days. @zara"""
+    _freeze(monkeypatch, local_now)
+
+    target = _next_local_occurrence(23, 55, 0)
+
+    assert target == expected_utc
+    assert target - dt_util.utcnow() == expected_delay